@@ -4,12 +4,171 @@ Decides what content gets into Working Memory and Global Workspace
 """
 
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from collections import namedtuple
+from enum import IntEnum
 import json
 import math
+import time
+
+import numpy as np
 
 from .schemas import BroadcastItem, AgentOutput, AgentType, NeuromodulatorState, ActiveRepresentation
 
+# Monotonic clock for hot-path timekeeping; avoids a datetime allocation
+# (and a total_seconds() call) per gating decision
+_now = time.monotonic
+
+# Shared read-only default for callers that omit 'neuromodulator_state';
+# avoids constructing a fresh NeuromodulatorState per batch. Do not mutate.
+_DEFAULT_NEUROMOD = NeuromodulatorState()
+
+# One bit per AgentType (definition order), so contributor membership tests
+# collapse to a single integer AND instead of scanning a Python collection
+_AGENT_BIT = {agent: 1 << i for i, agent in enumerate(AgentType)}
+
+# Agent types whose confidence is modulated by exploration noise (NE analog)
+_MASK_CREATIVE_STRATEGIC = _AGENT_BIT[AgentType.CREATIVE] | _AGENT_BIT[AgentType.STRATEGIC]
+
+# Query-intent labels mapped to the agent type they should boost
+INTENT_TO_AGENT = {
+    'logical': AgentType.LOGICAL,
+    'creative': AgentType.CREATIVE,
+    'factual': AgentType.VERIFIER,
+    'personal': AgentType.EMOTIONAL,
+}
+
+# Intent label straight to its agent bit, skipping the enum hop at runtime
+_INTENT_BIT = {intent: _AGENT_BIT[agent] for intent, agent in INTENT_TO_AGENT.items()}
+
+
+def _contrib_mask(contributors: List[AgentType]) -> int:
+    """Pack a contributor list into an AgentType bitmask"""
+    mask = 0
+    for agent in contributors:
+        mask |= _AGENT_BIT[agent]
+    return mask
+
+
+# Per-type extractors for (confidence, is_speculative, contributor mask); a single
+# dict probe on type(item) replaces the isinstance chain on the per-candidate path
+_EXTRACT = {
+    BroadcastItem: lambda i: (i.confidence, i.speculative, _contrib_mask(i.contributors)),
+    AgentOutput: lambda i: (i.confidence, False, _AGENT_BIT[i.agent]),
+}
+
+# Per-type resource cost estimators (see ResourceTracker.estimate_resource_cost)
+_COST = {
+    BroadcastItem: lambda i: 1.0 + (1.0 - i.confidence) + len(i.text) / 1000.0,
+    AgentOutput: lambda i: 0.5 + (1.0 - i.confidence) + len(i.reasoning_trace) / 10.0,
+}
+
+# Compact item-type ids for the columnar history buffers (0 = other)
+_TYPE_ID = {BroadcastItem: 1, AgentOutput: 2}
+_TYPE_NAME = {0: 'other', 1: 'BroadcastItem', 2: 'AgentOutput'}
+
+# Frozen per-batch view of the gating context: neuromodulator factors,
+# intent-boosted agent bitmask, and resource state resolved exactly once
+_GateCtx = namedtuple('_GateCtx', ['factors', 'boost_mask', 'budget', 'spec_ratio'])
+
+# Outcome codes returned by the flattened gating kernel (plain ints so the
+# numba-compiled kernel sees them as int64 globals)
+_GATE_OK = 0
+_GATE_FINAL_REJECT = 1
+_GATE_BELOW_THRESHOLD = 2
+_GATE_SPEC_LIMIT = 3
+_GATE_LOW_BUDGET = 4
+_GATE_UNKNOWN_ITEM = 5
+
+
+class GateReason(IntEnum):
+    """Gating outcome codes; human-readable text is formatted lazily"""
+    OK = _GATE_OK
+    FINAL_REJECT = _GATE_FINAL_REJECT
+    BELOW_THRESHOLD = _GATE_BELOW_THRESHOLD
+    SPEC_LIMIT = _GATE_SPEC_LIMIT
+    LOW_BUDGET = _GATE_LOW_BUDGET
+    UNKNOWN_ITEM = _GATE_UNKNOWN_ITEM
+
+
+# Lazy reason formatters, keyed by outcome code and invoked only when a
+# caller actually wants the string (args: policy, item, gctx, confidence, boost)
+_REASON_FORMATTERS = {
+    _GATE_OK: lambda p, i, g, c, b: f"Confidence: {c:.2f}, Speculative: {getattr(i, 'speculative', False)}, Priority boost: {b:.2f}",
+    _GATE_FINAL_REJECT: lambda p, i, g, c, b: f"Confidence: {c:.2f}, Speculative: {getattr(i, 'speculative', False)}, Priority boost: {b:.2f}",
+    _GATE_BELOW_THRESHOLD: lambda p, i, g, c, b: f"Below confidence threshold ({c:.2f} < {p.min_confidence_threshold})",
+    _GATE_SPEC_LIMIT: lambda p, i, g, c, b: f"Speculative ratio limit exceeded ({g.spec_ratio:.2f} >= {p.max_speculative_ratio})",
+    _GATE_LOW_BUDGET: lambda p, i, g, c, b: "Low resource budget, only high-confidence items allowed",
+    _GATE_UNKNOWN_ITEM: lambda p, i, g, c, b: "Unknown item type",
+}
+
+
+def _should_gate_fast(confidence: float, attention_factor: float,
+                      explore_factor: float, reward_factor: float,
+                      creative_bit: float, is_speculative: bool,
+                      speculative_ratio: float, max_speculative_ratio: float,
+                      resource_budget: float, min_confidence_threshold: float,
+                      boost_factor: float, boost_matches: int) -> Tuple[int, float, float]:
+    """Flattened scalar kernel for DeterministicGatingPolicy.should_gate.
+
+    Pure float/int math with no Python object access, so Numba can compile
+    it to machine code when available. Returns (code, confidence, boost).
+    """
+    # Branchless adjustment: fold the creative/strategic mask in as a 0/1
+    # float so the factor sequence is straight-line math with a single clamp
+    explore = 1.0 + creative_bit * (explore_factor - 1.0)
+    adjusted = min(confidence * attention_factor * explore * reward_factor, 1.0)
+
+    if adjusted < min_confidence_threshold:
+        return _GATE_BELOW_THRESHOLD, adjusted, 1.0
+    if is_speculative and speculative_ratio >= max_speculative_ratio:
+        return _GATE_SPEC_LIMIT, adjusted, 1.0
+    if resource_budget < 0.1 and adjusted < 0.7:
+        return _GATE_LOW_BUDGET, adjusted, 1.0
+
+    boost = boost_factor ** boost_matches
+    final = adjusted * boost
+    code = _GATE_OK if final >= min_confidence_threshold else _GATE_FINAL_REJECT
+    return code, final, boost
+
+
+try:  # Optional: compile the kernel when numba is installed
+    from numba import njit
+    _should_gate_fast = njit(cache=True, fastmath=True)(_should_gate_fast)
+except ImportError:
+    pass
+
+
+def _quality_passed(candidate: Any) -> Tuple[bool, str]:
+    """Quality gate: does the candidate carry a passing critique or verifier?
+
+    Short-circuits on the first passing report; metadata is a plain dict in
+    practice, so an exact class check beats isinstance here.
+    """
+    metadata = getattr(candidate, 'metadata', None)
+    if metadata:
+        critique = metadata.get('agentCritique') or metadata.get('agent_critique')
+        if critique.__class__ is dict and critique.get('passed') is True:
+            return True, "agentCritique.pass == True"
+        verifier = metadata.get('verifier')
+        if verifier.__class__ is dict and verifier.get('passed') is True:
+            return True, "verifier.passed == True"
+    return False, "No critic/verifier pass"
+
+
+def _count_recent(ts: np.ndarray, length: int, head: int, cutoff: float) -> int:
+    """Count ring-buffer timestamps >= cutoff.
+
+    The buffer is written chronologically, so each of the two wrapped
+    segments is sorted and a searchsorted per segment suffices.
+    """
+    if length < ts.shape[0]:
+        valid = ts[:length]
+        return length - int(np.searchsorted(valid, cutoff))
+    newer = ts[:head]   # most recent wrap
+    older = ts[head:]   # previous wrap
+    return ((head - int(np.searchsorted(newer, cutoff)))
+            + (older.shape[0] - int(np.searchsorted(older, cutoff))))
+
 
 class GatingPolicy:
     """Base class for gating policies"""
@@ -41,131 +200,111 @@ class DeterministicGatingPolicy(GatingPolicy):
     
     def should_gate(self, item: Any, context: Dict[str, Any]) -> Tuple[bool, float, str]:
         """Apply deterministic gating rules"""
-        neuromod_state = context.get('neuromodulator_state', NeuromodulatorState())
-        resource_budget = context.get('resource_budget', 1.0)
-        current_speculative_ratio = context.get('speculative_ratio', 0.0)
-        
-        # Extract confidence and other properties
-        if isinstance(item, BroadcastItem):
-            confidence = item.confidence
-            is_speculative = item.speculative
-            contributors = item.contributors
-        elif isinstance(item, AgentOutput):
-            confidence = item.confidence
-            is_speculative = False  # Agent outputs are not speculative by default
-            contributors = [item.agent]
-        else:
-            return False, 0.0, "Unknown item type"
-        
-        # Apply neuromodulator adjustments
-        adjusted_confidence = self._apply_neuromodulator_adjustments(
-            confidence, neuromod_state, contributors
+        # Per-batch state is frozen once by evaluate_candidates; direct
+        # single-item callers pay for building it here
+        gctx = context.get('_gate_ctx')
+        if gctx is None:
+            gctx = self._make_gate_ctx(context)
+        return self._should_gate_ctx(item, gctx)
+
+    def _make_gate_ctx(self, context: Dict[str, Any]) -> '_GateCtx':
+        """Freeze the per-batch slice of the context into a _GateCtx"""
+        return _GateCtx(
+            factors=self._precompute_neuromod(
+                context.get('neuromodulator_state', _DEFAULT_NEUROMOD)),
+            boost_mask=self._intent_boost_mask(context.get('query_intent', [])),
+            budget=context.get('resource_budget', 1.0),
+            spec_ratio=context.get('speculative_ratio', 0.0),
         )
-        
-        # Check basic thresholds
-        if adjusted_confidence < self.min_confidence_threshold:
-            return False, adjusted_confidence, f"Below confidence threshold ({adjusted_confidence:.2f} < {self.min_confidence_threshold})"
-        
-        # Check speculative ratio limit
-        if is_speculative and current_speculative_ratio >= self.max_speculative_ratio:
-            return False, adjusted_confidence, f"Speculative ratio limit exceeded ({current_speculative_ratio:.2f} >= {self.max_speculative_ratio})"
-        
-        # Check resource budget
-        if resource_budget < 0.1:  # Low resource budget
-            if adjusted_confidence < 0.7:  # Only high-confidence items
-                return False, adjusted_confidence, "Low resource budget, only high-confidence items allowed"
-        
-        # Priority boost for certain agent types
-        priority_boost = self._calculate_priority_boost(contributors, context)
-        final_confidence = adjusted_confidence * priority_boost
-        
-        # Final decision
-        should_gate = final_confidence >= self.min_confidence_threshold
-        
-        reason = f"Confidence: {final_confidence:.2f}, Speculative: {is_speculative}, Priority boost: {priority_boost:.2f}"
-        
-        return should_gate, final_confidence, reason
+
+    def _should_gate_ctx(self, item: Any, gctx: '_GateCtx') -> Tuple[bool, float, str]:
+        """Evaluate one item and format the reason for dict-based callers"""
+        should_gate, confidence, code, boost = self._evaluate_ctx(item, gctx)
+        reason = _REASON_FORMATTERS[code](self, item, gctx, confidence, boost)
+        return should_gate, confidence, reason
+
+    def _evaluate_ctx(self, item: Any, gctx: '_GateCtx') -> Tuple[bool, float, int, float]:
+        """Hot path: evaluate one item against a frozen per-batch context.
+
+        Returns (should_gate, confidence, reason_code, boost) without doing
+        any string formatting; reasons are rendered lazily via
+        _REASON_FORMATTERS when someone actually reads them.
+        """
+        # Extract confidence and other properties via type-dispatch table
+        extract = _EXTRACT.get(type(item))
+        if extract is None:
+            return False, 0.0, _GATE_UNKNOWN_ITEM, 1.0
+        confidence, is_speculative, contrib_mask = extract(item)
+
+        attention_factor, explore_factor, reward_factor = gctx.factors
+        code, final_confidence, priority_boost = _should_gate_fast(
+            confidence, attention_factor, explore_factor, reward_factor,
+            float(bool(contrib_mask & _MASK_CREATIVE_STRATEGIC)),
+            bool(is_speculative), gctx.spec_ratio, self.max_speculative_ratio,
+            gctx.budget, self.min_confidence_threshold,
+            self.priority_boost_factor, bin(contrib_mask & gctx.boost_mask).count('1')
+        )
+
+        return code == _GATE_OK, final_confidence, code, priority_boost
     
-    def _apply_neuromodulator_adjustments(self, confidence: float, 
-                                        neuromod_state: NeuromodulatorState,
-                                        contributors: List[AgentType]) -> float:
-        """Apply neuromodulator-based adjustments to confidence"""
-        adjusted_confidence = confidence
-        
-        # Attention gain (ACh analog) - increases thresholds
+    @staticmethod
+    def _precompute_neuromod(neuromod_state: NeuromodulatorState) -> Tuple[float, float, float]:
+        """Precompute neuromodulator factors once per batch of candidates"""
         attention_factor = 1.0 + (neuromod_state.attention_gain - 1.0) * 0.3
-        adjusted_confidence *= attention_factor
-        
-        # Exploration noise (NE analog) - affects creative/exploratory agents differently
-        if AgentType.CREATIVE in contributors or AgentType.STRATEGIC in contributors:
-            explore_factor = 1.0 + neuromod_state.explore_noise * 0.2
-            adjusted_confidence *= explore_factor
-        
-        # Reward signal (DA analog) - boosts recently successful patterns
-        if neuromod_state.reward_signal > 0:
-            reward_factor = 1.0 + neuromod_state.reward_signal * 0.1
-            adjusted_confidence *= reward_factor
-        
-        return min(adjusted_confidence, 1.0)  # Cap at 1.0
-    
-    def _calculate_priority_boost(self, contributors: List[AgentType], 
-                                context: Dict[str, Any]) -> float:
-        """Calculate priority boost based on agent types and context"""
-        boost = 1.0
-        
-        # Context-based boosts
-        query_intent = context.get('query_intent', [])
-        
-        # Boost logical agents for analytical queries
-        if 'logical' in query_intent and AgentType.LOGICAL in contributors:
-            boost *= self.priority_boost_factor
-        
-        # Boost creative agents for creative queries
-        if 'creative' in query_intent and AgentType.CREATIVE in contributors:
-            boost *= self.priority_boost_factor
-        
-        # Boost verifier agents for factual queries
-        if 'factual' in query_intent and AgentType.VERIFIER in contributors:
-            boost *= self.priority_boost_factor
-        
-        # Boost emotional agents for personal queries
-        if 'personal' in query_intent and AgentType.EMOTIONAL in contributors:
-            boost *= self.priority_boost_factor
-        
-        return boost
+        explore_factor = 1.0 + neuromod_state.explore_noise * 0.2
+        reward_factor = 1.0 + neuromod_state.reward_signal * 0.1 if neuromod_state.reward_signal > 0 else 1.0
+        return attention_factor, explore_factor, reward_factor
+
+    @staticmethod
+    def _intent_boost_mask(query_intent: List[str]) -> int:
+        """Resolve query-intent labels to a bitmask of boosted agent types"""
+        mask = 0
+        intent_bit = _INTENT_BIT
+        for intent in query_intent:
+            mask |= intent_bit.get(intent, 0)
+        return mask
 
 
 class AdaptiveGatingPolicy(DeterministicGatingPolicy):
     """Adaptive gating policy that learns from feedback"""
     
+    FEEDBACK_CAPACITY = 1000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.learning_rate = 0.01
-        self.success_history = []
-        self.failure_history = []
+        self.target_success_rate = 0.7
+        # Columnar ring buffer of feedback: wall-clock timestamps (callers
+        # may pass their own) plus success flags
+        cap = self.FEEDBACK_CAPACITY
+        self._fb_ts = np.zeros(cap, dtype=np.float64)
+        self._fb_success = np.zeros(cap, dtype=np.uint8)
+        self._fb_head = 0
+        self._fb_len = 0
         self.adaptive_thresholds = {
             'min_confidence': self.min_confidence_threshold,
             'max_speculative': self.max_speculative_ratio
         }
-    
+
     def should_gate(self, item: Any, context: Dict[str, Any]) -> Tuple[bool, float, str]:
         """Apply adaptive gating with learning"""
         # Get base decision
         should_gate, confidence, reason = super().should_gate(item, context)
-        
+
+        # Compute the success rate once and share it between the adjustment
+        # and the threshold update, halving the history scans per decision
+        success_rate = self._calculate_recent_success_rate()
+
         # Apply adaptive adjustments
-        adaptive_confidence = self._apply_adaptive_adjustments(confidence, context)
-        
+        adaptive_confidence = self._apply_adaptive_adjustments(confidence, success_rate)
+
         # Update thresholds based on history
-        self._update_thresholds()
-        
+        self._update_thresholds(success_rate)
+
         return should_gate, adaptive_confidence, f"{reason} (adaptive: {adaptive_confidence:.2f})"
-    
-    def _apply_adaptive_adjustments(self, confidence: float, context: Dict[str, Any]) -> float:
+
+    def _apply_adaptive_adjustments(self, confidence: float, recent_success_rate: float) -> float:
         """Apply adaptive adjustments based on learning history"""
-        # Simple adaptive adjustment based on recent success/failure
-        recent_success_rate = self._calculate_recent_success_rate()
-        
         if recent_success_rate > 0.8:  # High success rate
             # Slightly lower threshold to allow more items
             adjustment = 0.95
@@ -179,45 +318,47 @@ class AdaptiveGatingPolicy(DeterministicGatingPolicy):
     
     def _calculate_recent_success_rate(self) -> float:
         """Calculate recent success rate from history"""
-        if not self.success_history and not self.failure_history:
+        if not self._fb_len:
             return 0.5  # Default neutral
-        
-        recent_success = len([s for s in self.success_history if s > datetime.now().timestamp() - 3600])  # Last hour
-        recent_failure = len([f for f in self.failure_history if f > datetime.now().timestamp() - 3600])
-        
-        total_recent = recent_success + recent_failure
-        if total_recent == 0:
+
+        # Callers may record out-of-order wall-clock timestamps, so use a
+        # vectorized mask rather than assuming the buffer is sorted
+        cutoff = time.time() - 3600.0  # Last hour
+        in_window = self._fb_ts[:self._fb_len] > cutoff
+        recent = int(in_window.sum())
+        if not recent:
             return 0.5
-        
-        return recent_success / total_recent
+
+        successes = int(self._fb_success[:self._fb_len][in_window].sum())
+
+        return successes / recent
     
-    def _update_thresholds(self) -> None:
+    def _update_thresholds(self, success_rate: float) -> None:
         """Update adaptive thresholds based on performance"""
-        success_rate = self._calculate_recent_success_rate()
-        
-        # Adjust confidence threshold
-        if success_rate > 0.8:
-            self.adaptive_thresholds['min_confidence'] *= 0.99  # Lower threshold
-        elif success_rate < 0.5:
-            self.adaptive_thresholds['min_confidence'] *= 1.01  # Raise threshold
-        
+        # Proportional feedback: the step scales with distance from the
+        # target rate, so the threshold converges instead of creeping by a
+        # fixed factor on every call. High success still lowers the
+        # threshold (admit more), low success raises it. Step is bounded to
+        # +/-10% per update.
+        step = 1.0 - self.learning_rate * (success_rate / self.target_success_rate - 1.0)
+        self.adaptive_thresholds['min_confidence'] *= max(0.9, min(1.1, step))
+
         # Keep within bounds
         self.adaptive_thresholds['min_confidence'] = max(0.1, min(0.9, self.adaptive_thresholds['min_confidence']))
     
     def record_feedback(self, item_id: str, success: bool, timestamp: float = None) -> None:
         """Record feedback for learning"""
         if timestamp is None:
-            timestamp = datetime.now().timestamp()
-        
-        if success:
-            self.success_history.append(timestamp)
-        else:
-            self.failure_history.append(timestamp)
-        
-        # Keep only recent history (last 24 hours)
-        cutoff = datetime.now().timestamp() - 86400
-        self.success_history = [s for s in self.success_history if s > cutoff]
-        self.failure_history = [f for f in self.failure_history if f > cutoff]
+            timestamp = time.time()
+
+        # Ring buffer bounds memory; the 1-hour window filter in
+        # _calculate_recent_success_rate makes explicit pruning unnecessary
+        head = self._fb_head
+        self._fb_ts[head] = timestamp
+        self._fb_success[head] = success
+        self._fb_head = (head + 1) % self.FEEDBACK_CAPACITY
+        if self._fb_len < self.FEEDBACK_CAPACITY:
+            self._fb_len += 1
 
 
 class GateEngine:
@@ -226,9 +367,25 @@ class GateEngine:
     Analogous to basal ganglia gating in the brain
     """
     
+    HISTORY_CAPACITY = 1000
+
     def __init__(self, policy: Optional[GatingPolicy] = None):
         self.policy = policy or DeterministicGatingPolicy()
-        self.gating_history = []
+        # Columnar (SoA) ring buffer for the last HISTORY_CAPACITY decisions;
+        # parallel arrays are ~10x smaller than per-decision dicts and let the
+        # recency filters run as vectorized NumPy operations
+        cap = self.HISTORY_CAPACITY
+        self._hist_ts = np.zeros(cap, dtype=np.float64)
+        self._hist_gated = np.zeros(cap, dtype=np.uint8)
+        self._hist_conf = np.zeros(cap, dtype=np.float32)
+        self._hist_cost = np.zeros(cap, dtype=np.float32)
+        self._hist_type = np.zeros(cap, dtype=np.uint8)
+        self._hist_reason: List[Optional[str]] = [None] * cap
+        self._hist_head = 0
+        self._hist_len = 0
+        # Running aggregates kept in sync with the ring buffer so stats are O(1)
+        self._gated_count = 0
+        self._confidence_sum = 0.0
         self.resource_tracker = ResourceTracker()
         # Quarantine holds candidates that fail safety/quality gates (e.g., failed critique/verifier)
         self.quarantine: List[Any] = []
@@ -246,46 +403,54 @@ class GateEngine:
         """
         gated_items = []
         context = context.copy()
-        
+
         # Update context with current state
         context.update(self._get_current_context())
-        
+
+        # Freeze the per-batch gating context once for the whole batch
+        gctx = None
+        if isinstance(self.policy, DeterministicGatingPolicy):
+            gctx = self.policy._make_gate_ctx(context)
+            context['_gate_ctx'] = gctx
+
+        # Policies that don't override should_gate can skip reason formatting
+        # entirely; the history then stores the GateReason code instead of a
+        # pre-rendered string
+        use_fast = (gctx is not None and
+                    type(self.policy).should_gate is DeterministicGatingPolicy.should_gate)
+
         for candidate in candidates:
             # Safety-first quality gate: require critique pass OR verifier pass
             # Expect metadata on BroadcastItem containing these fields
-            quality_allowed = False
-            quality_reason = ""
-            candidate_metadata = getattr(candidate, 'metadata', {}) or {}
-            agent_critique = candidate_metadata.get('agentCritique') or candidate_metadata.get('agent_critique')
-            verifier_report = candidate_metadata.get('verifier')
-            if isinstance(agent_critique, dict) and agent_critique.get('passed') is True:
-                quality_allowed = True
-                quality_reason = "agentCritique.pass == True"
-            elif isinstance(verifier_report, dict) and verifier_report.get('passed') is True:
-                quality_allowed = True
-                quality_reason = "verifier.passed == True"
+            quality_allowed, quality_reason = _quality_passed(candidate)
 
             if not quality_allowed:
                 # Quarantine instead of allowing speculative/bad items into workspace
                 self.quarantine.append(candidate)
                 self._record_gating_decision(
-                    candidate,
-                    False,
-                    0.0,
-                    f"Blocked by quality gate: {quality_reason if quality_reason else 'No critic/verifier pass'}"
+                    candidate, False, 0.0,
+                    f"Blocked by quality gate: {quality_reason}"
                 )
                 continue
 
-            should_gate, confidence, reason = self.policy.should_gate(candidate, context)
-            
+            if use_fast:
+                should_gate, confidence, code, _boost = self.policy._evaluate_ctx(candidate, gctx)
+                reason = GateReason(code)
+            else:
+                should_gate, confidence, reason = self.policy.should_gate(candidate, context)
+
+            # Estimate the cost once and share it between the decision record
+            # and the resource tracker
+            cost = self.resource_tracker.estimate_resource_cost(candidate)
+
             # Record gating decision
-            self._record_gating_decision(candidate, should_gate, confidence, reason)
-            
+            self._record_gating_decision(candidate, should_gate, confidence, reason, cost)
+
             if should_gate:
                 gated_items.append(candidate)
                 
                 # Update resource tracking
-                self.resource_tracker.consume_resources(candidate)
+                self.resource_tracker.consume_resources(cost)
         
         return gated_items
 
@@ -308,12 +473,14 @@ class GateEngine:
         context.update(self._get_current_context())
         
         should_gate, confidence, reason = self.policy.should_gate(item, context)
-        
+
+        cost = self.resource_tracker.estimate_resource_cost(item)
+
         # Record gating decision
-        self._record_gating_decision(item, should_gate, confidence, reason)
-        
+        self._record_gating_decision(item, should_gate, confidence, reason, cost)
+
         if should_gate:
-            self.resource_tracker.consume_resources(item)
+            self.resource_tracker.consume_resources(cost)
         
         return should_gate, confidence, reason
     
@@ -322,52 +489,58 @@ class GateEngine:
         return {
             'resource_budget': self.resource_tracker.get_remaining_budget(),
             'speculative_ratio': self.resource_tracker.get_speculative_ratio(),
-            'gating_history_size': len(self.gating_history),
+            'gating_history_size': self._hist_len,
             'recent_gating_rate': self._calculate_recent_gating_rate()
         }
     
-    def _record_gating_decision(self, item: Any, should_gate: bool, 
-                              confidence: float, reason: str) -> None:
+    def _record_gating_decision(self, item: Any, should_gate: bool,
+                              confidence: float, reason: str,
+                              resource_cost: Optional[float] = None) -> None:
         """Record a gating decision for analysis"""
-        decision = {
-            'timestamp': datetime.now(),
-            'item_type': type(item).__name__,
-            'should_gate': should_gate,
-            'confidence': confidence,
-            'reason': reason,
-            'resource_consumed': self.resource_tracker.estimate_resource_cost(item)
-        }
-        
-        self.gating_history.append(decision)
-        
-        # Keep only recent history (last 1000 decisions)
-        if len(self.gating_history) > 1000:
-            self.gating_history = self.gating_history[-1000:]
+        if resource_cost is None:
+            resource_cost = self.resource_tracker.estimate_resource_cost(item)
+        head = self._hist_head
+
+        # Ring buffer: subtract the evicted record's contribution before overwriting
+        if self._hist_len == self.HISTORY_CAPACITY:
+            self._gated_count -= int(self._hist_gated[head])
+            self._confidence_sum -= float(self._hist_conf[head])
+        else:
+            self._hist_len += 1
+
+        self._hist_ts[head] = _now()
+        self._hist_gated[head] = should_gate
+        self._hist_conf[head] = confidence
+        self._hist_cost[head] = resource_cost
+        self._hist_type[head] = _TYPE_ID.get(type(item), 0)
+        self._hist_reason[head] = reason
+        self._hist_head = (head + 1) % self.HISTORY_CAPACITY
+
+        # Accumulate the stored (float32) value so eviction cancels exactly
+        self._gated_count += should_gate
+        self._confidence_sum += float(self._hist_conf[head])
     
     def _calculate_recent_gating_rate(self) -> float:
         """Calculate recent gating rate (items per minute)"""
-        if not self.gating_history:
+        if not self._hist_len:
             return 0.0
-        
-        now = datetime.now()
-        recent_decisions = [d for d in self.gating_history 
-                          if (now - d['timestamp']).total_seconds() < 300]  # Last 5 minutes
-        
-        return len(recent_decisions) / 5.0  # Rate per minute
+
+        cutoff = _now() - 300.0  # Last 5 minutes
+        recent = _count_recent(self._hist_ts, self._hist_len, self._hist_head, cutoff)
+
+        return recent / 5.0  # Rate per minute
     
     def get_gating_stats(self) -> Dict[str, Any]:
         """Get gating statistics"""
-        if not self.gating_history:
+        if not self._hist_len:
             return {'total_decisions': 0, 'gating_rate': 0.0, 'avg_confidence': 0.0}
-        
-        total_decisions = len(self.gating_history)
-        gated_count = sum(1 for d in self.gating_history if d['should_gate'])
-        avg_confidence = sum(d['confidence'] for d in self.gating_history) / total_decisions
-        
+
+        total_decisions = self._hist_len
+
         return {
             'total_decisions': total_decisions,
-            'gating_rate': gated_count / total_decisions,
-            'avg_confidence': avg_confidence,
+            'gating_rate': self._gated_count / total_decisions,
+            'avg_confidence': self._confidence_sum / total_decisions,
             'recent_gating_rate': self._calculate_recent_gating_rate(),
             'resource_usage': self.resource_tracker.get_usage_stats()
         }
@@ -376,45 +549,38 @@ class GateEngine:
 class ResourceTracker:
     """Tracks resource consumption for gating decisions"""
     
+    HISTORY_CAPACITY = 1000
+
     def __init__(self, max_budget: float = 100.0, decay_rate: float = 0.1):
         self.max_budget = max_budget
         self.current_budget = max_budget
         self.decay_rate = decay_rate
-        self.last_update = datetime.now()
-        self.consumption_history = []
-    
-    def consume_resources(self, item: Any) -> None:
-        """Consume resources for an item"""
-        cost = self.estimate_resource_cost(item)
+        self.last_update = _now()
+        # Columnar ring buffer mirroring GateEngine's decision history
+        cap = self.HISTORY_CAPACITY
+        self._cons_ts = np.zeros(cap, dtype=np.float64)
+        self._cons_cost = np.zeros(cap, dtype=np.float32)
+        self._cons_remaining = np.zeros(cap, dtype=np.float32)
+        self._cons_head = 0
+        self._cons_len = 0
+
+    def consume_resources(self, cost: float) -> None:
+        """Consume a precomputed resource cost (see estimate_resource_cost)"""
         self.current_budget = max(0, self.current_budget - cost)
-        
-        self.consumption_history.append({
-            'timestamp': datetime.now(),
-            'cost': cost,
-            'remaining_budget': self.current_budget
-        })
-        
-        # Keep only recent history
-        if len(self.consumption_history) > 1000:
-            self.consumption_history = self.consumption_history[-1000:]
+
+        head = self._cons_head
+        self._cons_ts[head] = _now()
+        self._cons_cost[head] = cost
+        self._cons_remaining[head] = self.current_budget
+        self._cons_head = (head + 1) % self.HISTORY_CAPACITY
+        if self._cons_len < self.HISTORY_CAPACITY:
+            self._cons_len += 1
     
     def estimate_resource_cost(self, item: Any) -> float:
         """Estimate resource cost for an item"""
-        if isinstance(item, BroadcastItem):
-            # Cost based on confidence and content length
-            base_cost = 1.0
-            confidence_factor = 1.0 - item.confidence  # Lower confidence = higher cost
-            length_factor = len(item.text) / 1000.0  # Longer content = higher cost
-            return base_cost + confidence_factor + length_factor
-        
-        elif isinstance(item, AgentOutput):
-            # Cost based on confidence and reasoning trace length
-            base_cost = 0.5
-            confidence_factor = 1.0 - item.confidence
-            trace_factor = len(item.reasoning_trace) / 10.0
-            return base_cost + confidence_factor + trace_factor
-        
-        return 1.0  # Default cost
+        # Base cost plus confidence penalty plus length factor, per item type
+        cost = _COST.get(type(item))
+        return cost(item) if cost is not None else 1.0  # Default cost
     
     def get_remaining_budget(self) -> float:
         """Get remaining resource budget"""
@@ -423,28 +589,33 @@ class ResourceTracker:
     
     def get_speculative_ratio(self) -> float:
         """Get ratio of speculative items in recent history"""
-        if not self.consumption_history:
+        if not self._cons_len:
             return 0.0
-        
-        recent_items = [h for h in self.consumption_history 
-                       if (datetime.now() - h['timestamp']).total_seconds() < 300]
-        
-        if not recent_items:
+
+        recent = _count_recent(self._cons_ts, self._cons_len, self._cons_head,
+                               _now() - 300.0)
+
+        if not recent:
             return 0.0
-        
+
         # This is a simplified calculation - in practice, you'd track speculative items separately
         return 0.0  # Placeholder
     
     def _apply_decay(self) -> None:
         """Apply resource budget decay over time"""
-        now = datetime.now()
-        time_since_update = (now - self.last_update).total_seconds() / 60.0  # minutes
-        
-        if time_since_update > 0:
-            # Restore budget over time
-            restoration = self.decay_rate * time_since_update * self.max_budget
-            self.current_budget = min(self.max_budget, self.current_budget + restoration)
-            self.last_update = now
+        now = _now()
+        elapsed = now - self.last_update
+
+        # Polls inside one gating batch arrive milliseconds apart; restoring
+        # budget for sub-second deltas is noise, so make the hot polling path
+        # a single float compare
+        if elapsed < 1.0:
+            return
+
+        # Restore budget over time
+        restoration = self.decay_rate * (elapsed / 60.0) * self.max_budget
+        self.current_budget = min(self.max_budget, self.current_budget + restoration)
+        self.last_update = now
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get resource usage statistics"""
@@ -453,6 +624,6 @@ class ResourceTracker:
             'current_budget': self.current_budget,
             'max_budget': self.max_budget,
             'usage_percentage': (self.max_budget - self.current_budget) / self.max_budget,
-            'recent_consumption': len([h for h in self.consumption_history 
-                                    if (datetime.now() - h['timestamp']).total_seconds() < 300])
+            'recent_consumption': _count_recent(self._cons_ts, self._cons_len,
+                                                self._cons_head, _now() - 300.0)
         }
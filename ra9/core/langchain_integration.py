@@ -2,27 +2,185 @@ import os
 from typing import List, Dict, Any, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema import HumanMessage, SystemMessage, AIMessage
-from langchain.memory import ConversationBufferMemory, ConversationSummaryMemory
+from langchain.memory import ConversationSummaryBufferMemory
 from langchain.agents import Tool, AgentExecutor, create_openai_functions_agent
 from langchain_community.tools import DuckDuckGoSearchRun, WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
 from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
 from dotenv import load_dotenv
+from pydantic import BaseModel
+import ast
+import asyncio
+import operator
+import queue
+import threading
+from functools import lru_cache
+import faiss
+import numpy as np
+import hashlib
 import json
 import re
-from tenacity import retry, stop_after_attempt, wait_exponential
+from collections import OrderedDict
+from tenacity import AsyncRetrying, retry, stop_after_attempt, wait_exponential
 
 load_dotenv()
 
+# Whitelisted arithmetic for calculate_tool; anything else is rejected
+_ALLOWED_BINOPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow,
+}
+_ALLOWED_UNARYOPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+@lru_cache(maxsize=1024)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Parse an arithmetic expression once; agents repeat expressions often."""
+    return ast.parse(expression, mode="eval")
+
+
+def _safe_eval(node):
+    """Evaluate a parsed arithmetic AST restricted to numeric operators."""
+    if isinstance(node, ast.Expression):
+        return _safe_eval(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _ALLOWED_BINOPS:
+        return _ALLOWED_BINOPS[type(node.op)](_safe_eval(node.left), _safe_eval(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _ALLOWED_UNARYOPS:
+        return _ALLOWED_UNARYOPS[type(node.op)](_safe_eval(node.operand))
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+class CachedEmbeddings:
+    """LRU cache in front of an embeddings model, keyed by text hash.
+
+    Conversational workloads repeat queries; a cache hit skips the whole
+    MiniLM forward pass (tens of milliseconds on CPU).
+    """
+
+    def __init__(self, base, maxsize: int = 4096):
+        self._base = base
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.encode()).digest()
+
+    def _get(self, key: bytes):
+        vector = self._cache.get(key)
+        if vector is not None:
+            self._cache.move_to_end(key)
+        return vector
+
+    def _put(self, key: bytes, vector) -> None:
+        self._cache[key] = vector
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self._base.embed_query(text)
+            self._put(key, vector)
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        vectors = [self._get(key) for key in keys]
+
+        # Batch-embed only the misses, then slot them back in place
+        miss_positions = [i for i, vector in enumerate(vectors) if vector is None]
+        if miss_positions:
+            fresh = self._base.embed_documents([texts[i] for i in miss_positions])
+            for position, vector in zip(miss_positions, fresh):
+                vectors[position] = vector
+                self._put(keys[position], vector)
+        return vectors
+
+
+def _select_embedding_device() -> str:
+    """Pick the fastest available device for MiniLM inference.
+
+    GPU encoding is roughly an order of magnitude faster than CPU for
+    this model; fall back to CPU when torch or an accelerator is absent.
+    """
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return 'cuda'
+        if getattr(torch.backends, 'mps', None) is not None and torch.backends.mps.is_available():
+            return 'mps'
+    except Exception:
+        pass
+    return 'cpu'
+
+
+# One MiniLM per process: loading the weights costs hundreds of
+# milliseconds and duplicates accelerator memory per copy
+_EMBED_MODEL = None
+_EMBED_MODEL_LOCK = threading.Lock()
+
+
+def _get_embeddings():
+    """Return the shared MiniLM embedding model, loading it on first use."""
+    global _EMBED_MODEL
+    if _EMBED_MODEL is None:
+        with _EMBED_MODEL_LOCK:
+            if _EMBED_MODEL is None:
+                _EMBED_MODEL = HuggingFaceEmbeddings(
+                    model_name="sentence-transformers/all-MiniLM-L6-v2",
+                    model_kwargs={'device': _select_embedding_device()},
+                    encode_kwargs={'batch_size': 64}
+                )
+    return _EMBED_MODEL
+
+
+class Assessment(BaseModel):
+    """Structured quality assessment returned by the Gemini assessor."""
+    score: float
+    feedback: str
+    should_continue: bool
+
+
+class RA9State:
+    """Mutable workflow state passed between LangGraph nodes.
+
+    __slots__ keeps attribute access and per-state memory cheap across the
+    up-to-10-iteration debate loop (slots=True dataclasses need 3.10+).
+    """
+    __slots__ = ('query', 'agents', 'debate_results', 'prior_summary', 'final_answer',
+                 'iteration', 'quality_score', 'score_history', 'tools_used',
+                 'feedback', 'analysis', 'should_continue')
+
+    def __init__(self, query: str = ""):
+        self.query = query
+        self.agents: List[str] = []
+        self.debate_results: Dict[str, str] = {}
+        self.prior_summary = ""
+        self.final_answer = ""
+        self.iteration = 0
+        self.quality_score = 0.0
+        self.score_history: List[float] = []
+        self.tools_used: List[str] = []
+        self.feedback = ""
+        self.analysis: Dict[str, Any] = {}
+        self.should_continue = True
+
+
 class RA9LangChainIntegration:
     """Advanced LangChain integration for RA9's cognitive system."""
-    
+
+    EMBEDDING_DIM = 384  # all-MiniLM-L6-v2 output size
+
     def __init__(self):
         self.llm = ChatGoogleGenerativeAI(
             model="gemini-2.0-flash",
@@ -31,26 +189,126 @@ class RA9LangChainIntegration:
             max_tokens=4000
         )
         
-        self.memory = ConversationBufferMemory(
+        # Summary-buffer memory keeps recent turns verbatim and folds older
+        # ones into a summary, capping per-turn prompt tokens instead of
+        # growing linearly with session length
+        self.memory = ConversationSummaryBufferMemory(
+            llm=self.llm,
+            max_token_limit=2048,
             memory_key="chat_history",
             return_messages=True,
             input_key="input"
         )
         
-        self.vector_memory = None
+        self.embeddings = None
+        self.index = None
+        self.docs: List[tuple] = []
         self.tools = []
         self.agent_executor = None
+        # Built executors keyed by sorted tool names; agent construction
+        # walks every tool schema, so repeat calls reuse the result
+        self._executor_cache: Dict[tuple, AgentExecutor] = {}
         self.workflow_graph = None
+        # Set while execute_langchain_workflow_stream is consuming tokens
+        self._stream_queue: Optional["queue.Queue"] = None
         
         self._initialize_tools()
         self._initialize_vector_memory()
+        self._initialize_prompts()
         self._initialize_workflow()
 
+    def _initialize_prompts(self):
+        """Build all prompt templates once; nodes reuse them every iteration."""
+        self._analyze_tmpl = PromptTemplate(
+            input_variables=["query"],
+            template="""
+            Analyze this query and determine its complexity and requirements:
+
+            Query: {query}
+
+            Respond in JSON format:
+            {{
+                "complexity": <1-10>,
+                "required_agents": ["agent1", "agent2"],
+                "tools_needed": ["tool1", "tool2"],
+                "reasoning_depth": "<description>"
+            }}
+            """
+        )
+
+        self._debate_tmpl = PromptTemplate(
+            input_variables=["query", "agent", "previous_results", "tools_available", "previous_feedback"],
+            template="""
+            You are the {agent} agent in RA9's cognitive system.
+
+            Query: {query}
+            Previous Results: {previous_results}
+            Available Tools: {tools_available}
+            Previous Feedback for Improvement: {previous_feedback}
+
+            Provide your analysis and perspective, considering the feedback for improvement:
+            """
+        )
+
+        self._assess_tmpl = PromptTemplate(
+            input_variables=["query", "results", "iteration"],
+            template="""
+            Assess the quality of these debate results for the given query. Provide **specific, actionable feedback** on what needs to be improved to achieve a perfect 10/10 score. Suggest concrete approaches or areas of focus for the next iteration.
+
+            Query: {query}
+            Results: {results}
+            Iteration: {iteration}
+
+            Rate from 1-10 and provide detailed, actionable feedback. Ensure your response is in strict JSON format:
+            {
+                "score": <number, 1-10>,
+                "feedback": "<detailed, actionable feedback for improvement>",
+                "should_continue": <true/false, based on whether further iterations are needed to reach 10/10>
+            }
+            """
+        )
+
+        self._synth_tmpl = PromptTemplate(
+            input_variables=["query", "results", "quality_score"],
+            template="""
+            Synthesize the final answer from all agent debate results:
+
+            Query: {query}
+            Debate Results: {results}
+            Quality Score: {quality_score}/10
+
+            Create a comprehensive, well-structured response:
+            """
+        )
+
+        # LLMChain instances are cached per template; construction (and its
+        # Pydantic validation) happens once, not per call
+        self._chains = {}
+
+        # Gemini's structured output mode returns a validated Assessment
+        # directly, skipping regex extraction and its forced re-iterations
+        try:
+            self._assessor = self.llm.with_structured_output(Assessment)
+        except Exception as e:
+            print(f"Warning: structured assessment unavailable: {e}", flush=True)
+            self._assessor = None
+
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=4, max=60))
     def _call_llm(self, prompt_template, **kwargs):
-        chain = LLMChain(llm=self.llm, prompt=prompt_template)
+        chain = self._chains.get(id(prompt_template))
+        if chain is None:
+            chain = LLMChain(llm=self.llm, prompt=prompt_template)
+            self._chains[id(prompt_template)] = chain
         return chain.invoke(kwargs)
 
+    async def _acall_llm(self, prompt: str):
+        """Async LLM call with the same retry policy as _call_llm."""
+        async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(5),
+                wait=wait_exponential(multiplier=1, min=4, max=60)):
+            with attempt:
+                return await self.llm.ainvoke(prompt)
+
     def _initialize_tools(self):
         """Initialize LangChain tools for RA9."""
         
@@ -62,28 +320,23 @@ class RA9LangChainIntegration:
         def calculate_tool(expression: str) -> str:
             """Calculate mathematical expressions."""
             try:
-                return str(eval(expression))
+                return str(_safe_eval(_parse_expression(expression)))
             except:
                 return "Error: Invalid mathematical expression"
         
         def memory_store_tool(content: str, category: str = "general") -> str:
             """Store information in RA9's memory."""
             try:
-                if self.vector_memory:
-                    self.vector_memory.add_texts([content], metadatas=[{"category": category}])
+                self.store_memory(content, {"category": category})
                 return f"Stored in memory under category: {category}"
             except:
                 return "Error storing in memory"
-        
+
         def memory_retrieve_tool(query: str, category: str = None) -> str:
             """Retrieve information from RA9's memory."""
             try:
-                if self.vector_memory:
-                    if category:
-                        results = self.vector_memory.similarity_search(query, k=3, filter={"category": category})
-                    else:
-                        results = self.vector_memory.similarity_search(query, k=3)
-                    return "\n".join([doc.page_content for doc in results])
+                if self.index is not None:
+                    return "\n".join(self._search_memory(query, k=3, category=category))
                 return "No memory available"
             except:
                 return "Error retrieving from memory"
@@ -116,40 +369,62 @@ class RA9LangChainIntegration:
                 func=memory_retrieve_tool
             )
         ]
+
+        # The tool list is fixed after init; bake its prompt form once so
+        # debate prompts keep a byte-identical preamble (provider prompt
+        # caches can hit) instead of rebuilding a list per agent call
+        self._tool_names_str = ", ".join(tool.name for tool in self.tools)
     
     def _initialize_vector_memory(self):
         """Initialize vector memory for RA9."""
         try:
-            embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2",
-                model_kwargs={'device': 'cpu'}
-            )
-            
-            self.vector_memory = Chroma(
-                collection_name="ra9_memory",
-                embedding_function=embeddings,
-                persist_directory="./memory/vector_store"
-            )
+            self.embeddings = CachedEmbeddings(_get_embeddings())
+
+            # FAISS inner-product search over L2-normalized embeddings is
+            # cosine similarity in BLAS-accelerated C++, without a vector
+            # store's sqlite/Python layer per query
+            self.index = faiss.IndexFlatIP(self.EMBEDDING_DIM)
+            self.docs = []  # (content, metadata) aligned with index rows
         except Exception as e:
             print(f"Warning: Vector memory initialization failed: {e}")
-            self.vector_memory = None
+            self.embeddings = None
+            self.index = None
+            self.docs = []
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed and L2-normalize texts for the inner-product index."""
+        vectors = np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def _search_memory(self, query: str, k: int = 3, category: Optional[str] = None) -> List[str]:
+        """Return the k most similar stored contents, optionally by category."""
+        if self.index is None or not self.docs:
+            return []
+
+        query_vec = np.asarray([self.embeddings.embed_query(query)], dtype=np.float32)
+        faiss.normalize_L2(query_vec)
+
+        # With a category filter, over-fetch and filter on metadata
+        fetch_k = len(self.docs) if category else min(k, len(self.docs))
+        _, ids = self.index.search(query_vec, fetch_k)
+
+        results = []
+        for idx in ids[0]:
+            if idx < 0:
+                continue
+            content, metadata = self.docs[idx]
+            if category is not None and metadata.get("category") != category:
+                continue
+            results.append(content)
+            if len(results) >= k:
+                break
+        return results
     
     def _initialize_workflow(self):
         """Initialize LangGraph workflow for RA9."""
-        
-        # Define the state schema
-        class RA9State:
-            def __init__(self):
-                self.query = ""
-                self.agents = []
-                self.debate_results = {}
-                self.final_answer = ""
-                self.iteration = 0
-                self.quality_score = 0.0
-                self.tools_used = []
-                self.feedback = "" # New field for feedback
-        
-        # Create workflow graph
+
+        # Create workflow graph over the slotted state schema
         workflow = StateGraph(RA9State)
         
         # Add nodes
@@ -180,24 +455,7 @@ class RA9LangChainIntegration:
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=4, max=60))
     def _analyze_query_node(self, state):
         """Analyze the query complexity and requirements."""
-        analysis_prompt = PromptTemplate(
-            input_variables=["query"],
-            template="""
-            Analyze this query and determine its complexity and requirements:
-            
-            Query: {query}
-            
-            Respond in JSON format:
-            {{
-                "complexity": <1-10>,
-                "required_agents": ["agent1", "agent2"],
-                "tools_needed": ["tool1", "tool2"],
-                "reasoning_depth": "<description>"
-            }}
-            """
-        )
-        
-        result = self._call_llm(analysis_prompt, query=state.query)
+        result = self._call_llm(self._analyze_tmpl, query=state.query)
         
         try:
             analysis = json.loads(result.content)
@@ -217,61 +475,77 @@ class RA9LangChainIntegration:
         state.agents = state.analysis.get("required_agents", ["logical", "emotional"])
         return state
     
-    @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=4, max=60))
     def _agent_debate_node(self, state):
         """Execute agent debate round."""
         state.iteration += 1
-        
-        for agent in state.agents:
-            agent_prompt = PromptTemplate(
-                input_variables=["query", "agent", "previous_results", "tools_available", "previous_feedback"],
-                template="""
-                You are the {agent} agent in RA9's cognitive system.
-                
-                Query: {query}
-                Previous Results: {previous_results}
-                Available Tools: {tools_available}
-                Previous Feedback for Improvement: {previous_feedback}
-                
-                Provide your analysis and perspective, considering the feedback for improvement:
-                """
-            )
-            
-            result = self._call_llm(
-                agent_prompt,
+
+        # Agents in a round are independent, so their LLM calls run
+        # concurrently; each sees a bounded summary of previous rounds
+        # rather than every agent's full output, keeping per-iteration
+        # input tokens constant instead of multiplying by agent count
+        previous_results = state.prior_summary or "None yet."
+        prompts = [
+            self._debate_tmpl.format(
                 query=state.query,
                 agent=agent,
-                previous_results=str(state.debate_results),
-                tools_available=[tool.name for tool in self.tools],
+                previous_results=previous_results,
+                tools_available=self._tool_names_str,
                 previous_feedback=state.feedback
             )
-            
+            for agent in state.agents
+        ]
+
+        async def _debate_round():
+            return await asyncio.gather(
+                *(self._acall_llm(prompt) for prompt in prompts),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(_debate_round())
+
+        for agent, result in zip(state.agents, results):
+            if isinstance(result, Exception):
+                print(f"Agent {agent} debate call failed: {result}", flush=True)
+                continue
             state.debate_results[agent] = result.content # Store content of the result
-        
+
+        # Roll the round into a short summary for the next iteration's
+        # prompts; on failure, fall back to a truncated raw dump
+        try:
+            state.prior_summary = self.llm.invoke(
+                "Summarize this agent debate round in at most 150 tokens, "
+                "preserving the key claims and disagreements:\n"
+                + str(state.debate_results)
+            ).content
+        except Exception as e:
+            print(f"Debate summary failed, truncating raw results: {e}", flush=True)
+            state.prior_summary = str(state.debate_results)[:2000]
+
         return state
     
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=4, max=60))
     def _assess_quality_node(self, state):
         """Assess the quality of current results."""
-        assessment_prompt = PromptTemplate(
-            input_variables=["query", "results", "iteration"],
-            template="""
-            Assess the quality of these debate results for the given query. Provide **specific, actionable feedback** on what needs to be improved to achieve a perfect 10/10 score. Suggest concrete approaches or areas of focus for the next iteration.
-
-            Query: {query}
-            Results: {results}
-            Iteration: {iteration}
+        if self._assessor is not None:
+            try:
+                assessment = self._assessor.invoke(
+                    "Assess the quality of these debate results for the given query. "
+                    "Provide specific, actionable feedback on what needs to be improved "
+                    "to achieve a perfect 10/10 score, and whether further iterations "
+                    "are needed.\n\n"
+                    f"Query: {state.query}\n"
+                    f"Results: {state.debate_results}\n"
+                    f"Iteration: {state.iteration}"
+                )
+                state.quality_score = assessment.score
+                state.should_continue = assessment.should_continue
+                state.feedback = assessment.feedback
+                state.score_history.append(state.quality_score)
+                return state
+            except Exception as e:
+                print(f"Structured assessment failed, falling back to JSON parse: {e}", flush=True)
 
-            Rate from 1-10 and provide detailed, actionable feedback. Ensure your response is in strict JSON format:
-            {
-                "score": <number, 1-10>,
-                "feedback": "<detailed, actionable feedback for improvement>",
-                "should_continue": <true/false, based on whether further iterations are needed to reach 10/10>
-            }
-            """
-        )
-        
-        result = self._call_llm(assessment_prompt, query=state.query, results=str(state.debate_results), iteration=state.iteration)
+        result = self._call_llm(self._assess_tmpl, query=state.query, results=str(state.debate_results), iteration=state.iteration)
         
         print(f"DEBUG: Raw LLM response for quality assessment: {result.content}", flush=True)
 
@@ -295,7 +569,8 @@ class RA9LangChainIntegration:
             state.quality_score = 3.0 # Significantly lower score for other errors
             state.should_continue = True # Force continuation
             state.feedback = f"Quality assessment failed due to unexpected error: {e}. Raw: {result.content}"
-        
+
+        state.score_history.append(state.quality_score)
         return state
     
     def _should_continue(self, state):
@@ -304,7 +579,17 @@ class RA9LangChainIntegration:
         if state.quality_score >= 9.5 and not state.should_continue:
             print("Synthesizing final answer: High quality and assessment says no more iterations.", flush=True)
             return "synthesize"
-        elif state.iteration >= 10:
+        # Plateau cutoff: when the score has stopped moving, further rounds
+        # only burn agents+1 LLM calls each; self-critiquing models stall
+        # like this often, so end the debate regardless of should_continue
+        history = state.score_history
+        if len(history) >= 3 and max(history[-3:]) - min(history[-3:]) < 0.2:
+            print("Synthesizing final answer: Quality score plateaued over last 3 rounds.", flush=True)
+            return "synthesize"
+        if len(history) >= 3 and history[-1] < history[-2] < history[-3]:
+            print("Synthesizing final answer: Quality score declining; further rounds are regressing.", flush=True)
+            return "synthesize"
+        if state.iteration >= 10:
             print("Ending workflow: Max iterations reached.", flush=True)
             return END
         elif state.should_continue and state.quality_score < 9.5:
@@ -317,43 +602,31 @@ class RA9LangChainIntegration:
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=4, max=60))
     def _synthesize_node(self, state):
         """Synthesize final answer from all debate results."""
-        synthesis_prompt = PromptTemplate(
-            input_variables=["query", "results", "quality_score"],
-            template="""
-            Synthesize the final answer from all agent debate results:
-            
-            Query: {query}
-            Debate Results: {results}
-            Quality Score: {quality_score}/10
-            
-            Create a comprehensive, well-structured response:
-            """
-        )
-        
-        state.final_answer = self._call_llm(
-            synthesis_prompt,
+        # Streaming makes the first tokens available orders of magnitude
+        # sooner than a blocking completion; a consumer attached via
+        # execute_langchain_workflow_stream sees them immediately
+        prompt = self._synth_tmpl.format(
             query=state.query,
             results=str(state.debate_results),
             quality_score=state.quality_score
-        ).content
-        
+        )
+        chunks = []
+        for chunk in self.llm.stream(prompt):
+            content = getattr(chunk, 'content', '')
+            if content:
+                chunks.append(content)
+                if self._stream_queue is not None:
+                    self._stream_queue.put(content)
+        state.final_answer = "".join(chunks)
+
         return state
     
     def execute_langchain_workflow(self, query: str) -> Dict[str, Any]:
         """Execute the complete LangChain workflow."""
         
         # Initialize state
-        state = type('State', (), {
-            'query': query,
-            'agents': [],
-            'debate_results': {},
-            'final_answer': "",
-            'iteration': 0,
-            'quality_score': 0.0,
-            'tools_used': [],
-            'feedback': "" # Initialize new field
-        })()
-        
+        state = RA9State(query)
+
         # Execute workflow
         final_state = self.workflow_graph.invoke(state)
         
@@ -364,13 +637,53 @@ class RA9LangChainIntegration:
             "agents_used": final_state.agents,
             "debate_results": final_state.debate_results
         }
-    
+
+    def execute_langchain_workflow_stream(self, query: str):
+        """Run the workflow, yielding final-answer tokens as they arrive.
+
+        The workflow runs on a background thread; synthesis tokens are
+        forwarded through a queue so callers can render (or post-process)
+        the answer while Gemini is still generating. The completed result
+        dict is the generator's return value.
+        """
+        self._stream_queue = queue.Queue()
+        outcome = {}
+
+        def _run():
+            try:
+                outcome['result'] = self.execute_langchain_workflow(query)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                self._stream_queue.put(None)  # end-of-stream sentinel
+
+        worker = threading.Thread(target=_run, daemon=True)
+        worker.start()
+        try:
+            while True:
+                token = self._stream_queue.get()
+                if token is None:
+                    break
+                yield token
+        finally:
+            worker.join()
+            self._stream_queue = None
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
     def create_agent_executor(self, tools: List[Tool] = None) -> AgentExecutor:
         """Create a LangChain agent executor with tools."""
         
         if tools is None:
             tools = self.tools
-        
+
+        cache_key = tuple(sorted(tool.name for tool in tools))
+        cached = self._executor_cache.get(cache_key)
+        if cached is not None:
+            self.agent_executor = cached
+            return cached
+
         # Create agent prompt
         agent_prompt = PromptTemplate(
             input_variables=["input", "agent_scratchpad"],
@@ -410,23 +723,36 @@ class RA9LangChainIntegration:
             verbose=True,
             max_iterations=10
         )
-        
+        self._executor_cache[cache_key] = self.agent_executor
+
         return self.agent_executor
     
     def store_memory(self, content: str, metadata: Dict = None):
         """Store content in vector memory."""
-        if self.vector_memory:
-            if metadata is None:
-                metadata = {"category": "general"}
-            self.vector_memory.add_texts([content], metadatas=[metadata])
-    
+        self.store_memory_batch([content], [metadata] if metadata else None)
+
+    def store_memory_batch(self, contents: List[str], metadatas: Optional[List[Dict]] = None):
+        """Store several contents with a single batched embedding pass.
+
+        One embed_documents call amortizes the tokenizer and model fixed
+        cost across the whole batch instead of paying it per item.
+        """
+        if self.index is None or not contents:
+            return
+        if metadatas is None:
+            metadatas = [{"category": "general"} for _ in contents]
+        self.index.add(self._embed_texts(contents))
+        self.docs.extend(zip(contents, metadatas))
+
     def retrieve_memory(self, query: str, k: int = 3) -> List[str]:
         """Retrieve relevant content from memory."""
-        if self.vector_memory:
-            results = self.vector_memory.similarity_search(query, k=k)
-            return [doc.page_content for doc in results]
-        return []
+        return self._search_memory(query, k=k)
 
+@lru_cache(maxsize=1)
 def create_langchain_integration():
-    """Create and return LangChain integration instance."""
-    return RA9LangChainIntegration() 
\ No newline at end of file
+    """Return the process-wide LangChain integration instance.
+
+    Construction rebuilds the Gemini client, loads embeddings and compiles
+    the workflow graph; a singleton amortizes that across all callers.
+    """
+    return RA9LangChainIntegration()
\ No newline at end of file
@@ -5,13 +5,72 @@ Small specialized models that produce candidate "micro-answers"
 
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import atexit
+import hashlib
 import json
 import asyncio
+import re
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .schemas import AgentOutput, AgentType, ContextBundle, Percept
 from . import validators
-from ..tools.tool_api import ask_gemini
+from ..tools.tool_api import ask_gemini, ask_gemini_async, httpx
+
+
+# Citation patterns, compiled once; _extract_citations runs them for
+# every reasoner on every query
+_CITATION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\[(\d+)\]',  # [1], [2], etc.
+    r'\(([^)]+)\)',  # (source), (reference)
+    r'according to ([^,\.]+)',
+    r'as stated in ([^,\.]+)',
+    r'research shows ([^,\.]+)'
+))
+
+
+# LRU of recent Gemini responses keyed by prompt hash; identical prompts
+# (retries, repeated queries) replay for free instead of paying full
+# token cost again. Only low-temperature calls are cached — sampling
+# variety is the point of high temperature.
+_RESPONSE_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 1024
+_CACHEABLE_TEMPERATURE = 0.3
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(prompt: str) -> bytes:
+    return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+
+def _response_cache_get(key: bytes) -> Optional[str]:
+    with _response_cache_lock:
+        response = _RESPONSE_CACHE.get(key)
+        if response is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+        return response
+
+
+def _response_cache_put(key: bytes, response: str) -> None:
+    with _response_cache_lock:
+        _RESPONSE_CACHE[key] = response
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+# Separator the batched executor asks the model to emit between the
+# per-role responses of a combined prompt
+_BATCH_SEP = "<<<SEP>>>"
+
+# One compiled check for reasoning-trace lines: numbered steps, bullets,
+# or lines mentioning step(s)/reasoning — replaces four Python-level
+# scans per line. The boundary keeps 'misstep' excluded while the
+# optional plural keeps phrasings like "the steps I followed" matching
+_TRACE_RE = re.compile(r'^(?:[1-5]\.|[-*•]|.*\b(?:steps?|reasoning)\b)', re.IGNORECASE)
+
+# Keyword table for _calculate_confidence, built once at module scope
+_UNCERTAINTY_WORDS = ('maybe', 'perhaps', 'might', 'could', 'unclear', 'not sure', 'possibly')
 
 
 class LocalReasoner:
@@ -23,6 +82,13 @@ class LocalReasoner:
         self.prompt_template = prompt_template
         self.confidence_threshold = 0.3
         self.max_reasoning_steps = 5
+        # Static prompt prefix, byte-identical across calls so provider
+        # prompt caches can hit; all dynamic values go in the suffix
+        self._cached_prefix = f"""
+{self.prompt_template}
+
+Role: {self.role}
+"""
     
     def run(self, context: ContextBundle, neuromodulation_params: Dict[str, float] = None) -> AgentOutput:
         """
@@ -40,10 +106,45 @@ class LocalReasoner:
         
         # Build prompt with context
         prompt = self._build_prompt(context, neuromodulation_params)
-        
-        # Generate response
-        response = ask_gemini(prompt)
-        
+
+        # Generate response, replaying cached output for repeat prompts
+        cacheable = neuromodulation_params.get('temperature', 0.7) <= _CACHEABLE_TEMPERATURE
+        key = _response_cache_key(prompt) if cacheable else None
+        response = _response_cache_get(key) if cacheable else None
+        if response is None:
+            response = ask_gemini(prompt)
+            if cacheable:
+                _response_cache_put(key, response)
+
+        return self._finalize(response, neuromodulation_params, context)
+
+    async def run_async(self, context: ContextBundle,
+                        neuromodulation_params: Dict[str, float] = None,
+                        client=None) -> AgentOutput:
+        """Async counterpart of run for concurrent suite execution.
+
+        Awaits the Gemini call on the shared event loop (one socket wait
+        instead of one blocked thread per reasoner); post-processing is
+        identical to the sync path.
+        """
+        if neuromodulation_params is None:
+            neuromodulation_params = {}
+
+        prompt = self._build_prompt(context, neuromodulation_params)
+
+        cacheable = neuromodulation_params.get('temperature', 0.7) <= _CACHEABLE_TEMPERATURE
+        key = _response_cache_key(prompt) if cacheable else None
+        response = _response_cache_get(key) if cacheable else None
+        if response is None:
+            response = await ask_gemini_async(prompt, client=client)
+            if cacheable:
+                _response_cache_put(key, response)
+
+        return self._finalize(response, neuromodulation_params, context)
+
+    def _finalize(self, response: str, neuromodulation_params: Dict[str, float],
+                  context: ContextBundle) -> AgentOutput:
+        """Turn a raw model response into a validated AgentOutput."""
         # Extract reasoning trace
         reasoning_trace = self._extract_reasoning_trace(response)
         
@@ -71,20 +172,24 @@ class LocalReasoner:
     
     def _build_prompt(self, context: ContextBundle, neuromodulation_params: Dict[str, float]) -> str:
         """Build the prompt for this reasoner"""
-        # Apply neuromodulation to prompt
+        return self._cached_prefix + self._dynamic_suffix(context, neuromodulation_params)
+
+    def _dynamic_suffix(self, context: ContextBundle, neuromodulation_params: Dict[str, float]) -> str:
+        """Per-call tail of the prompt: query, context and neuromodulation.
+
+        Labels are sorted and floats rounded to 2 decimals so equivalent
+        contexts render identically and minor neuromodulation jitter does
+        not perturb otherwise-repeated prompts.
+        """
         temperature = neuromodulation_params.get('temperature', 0.7)
         confidence_boost = neuromodulation_params.get('confidence', 1.0)
-        
-        prompt = f"""
-{self.prompt_template}
 
-Role: {self.role}
-Query: {context.percept.raw_text}
+        return f"""Query: {context.percept.raw_text}
 
 Context:
 - Modality: {context.percept.modality.value}
 - Reasoning Depth: {context.reasoning_depth}
-- Labels: {', '.join(context.labels)}
+- Labels: {', '.join(sorted(context.labels))}
 - Memory Context: {self._format_memory_context(context.memories)}
 
 Instructions:
@@ -96,7 +201,6 @@ Instructions:
 
 Response:
 """
-        return prompt
     
     def _extract_reasoning_trace(self, response: str) -> List[str]:
         """Extract reasoning steps from response"""
@@ -106,10 +210,7 @@ Response:
         
         for line in lines:
             line = line.strip()
-            if (line.startswith(('1.', '2.', '3.', '4.', '5.')) or 
-                line.startswith(('-', '*', '•')) or
-                'step' in line.lower() or
-                'reasoning' in line.lower()):
+            if _TRACE_RE.match(line):
                 reasoning_steps.append(line)
         
         # If no explicit steps found, split by sentences
@@ -122,33 +223,32 @@ Response:
     def _calculate_confidence(self, response: str, reasoning_trace: List[str], 
                             neuromodulation_params: Dict[str, float]) -> float:
         """Calculate confidence score for the response"""
-        base_confidence = 0.5
-        
+        # No content, no confidence
+        if not response.strip():
+            return 0.0
+
         # Length factor - longer responses often more confident
         length_factor = min(len(response) / 500.0, 1.0)
-        
+
         # Reasoning trace factor
         trace_factor = min(len(reasoning_trace) / 3.0, 1.0)
-        
-        # Uncertainty indicators
-        uncertainty_words = ['maybe', 'perhaps', 'might', 'could', 'unclear', 'not sure', 'possibly']
-        uncertainty_count = sum(1 for word in uncertainty_words if word.lower() in response.lower())
-        uncertainty_factor = max(0.0, 1.0 - (uncertainty_count * 0.1))
-        
-        # Confidence indicators
-        confidence_words = ['definitely', 'certainly', 'sure', 'clearly', 'obviously', 'confident']
-        confidence_count = sum(1 for word in confidence_words if word.lower() in response.lower())
-        confidence_factor = min(1.0, 1.0 + (confidence_count * 0.05))
-        
-        # Calculate final confidence
-        final_confidence = (base_confidence + length_factor + trace_factor + 
-                          uncertainty_factor + confidence_factor) / 5.0
-        
+
+        # Uncertainty indicators; at most 7 keywords can match, so the
+        # factor stays in [0.3, 1.0] without a clamp
+        response_lower = response.lower()
+        uncertainty_count = sum(1 for word in _UNCERTAINTY_WORDS if word in response_lower)
+        uncertainty_factor = 1.0 - (uncertainty_count * 0.1)
+
+        # Five-factor average folded into one expression. The old
+        # confidence-word factor, min(1.0, 1.0 + n * 0.05), equals 1.0 for
+        # every n, so it contributes as a constant (with base 0.5) and the
+        # keyword scan it paid for is dropped.
+        final_confidence = (1.5 + length_factor + trace_factor + uncertainty_factor) * 0.2
+
         # Apply neuromodulation
-        neuromod_confidence = neuromodulation_params.get('confidence', 1.0)
-        final_confidence *= neuromod_confidence
-        
-        return max(0.0, min(1.0, final_confidence))
+        final_confidence *= neuromodulation_params.get('confidence', 1.0)
+
+        return min(1.0, final_confidence)
 
     def _build_confidence_rationale(self, response: str, reasoning_trace: List[str], neuromodulation_params: Dict[str, float]) -> str:
         """Generate a concise rationale for the numeric confidence."""
@@ -166,44 +266,39 @@ Response:
     def _extract_citations(self, response: str) -> List[Dict[str, Any]]:
         """Extract citations from response"""
         citations = []
-        
-        # Look for citation patterns
-        import re
-        citation_patterns = [
-            r'\[(\d+)\]',  # [1], [2], etc.
-            r'\(([^)]+)\)',  # (source), (reference)
-            r'according to ([^,\.]+)',
-            r'as stated in ([^,\.]+)',
-            r'research shows ([^,\.]+)'
-        ]
-        
-        for pattern in citation_patterns:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            for match in matches:
+        seen = set()
+
+        for pattern in _CITATION_PATTERNS:
+            for match in pattern.findall(response):
+                source = match.strip()
+                if source in seen:  # Same source matched again; skip the noise
+                    continue
+                seen.add(source)
                 citations.append({
-                    'source': match,
+                    'source': source,
                     'score': 0.8,  # Default confidence
                     'type': 'text_reference'
                 })
-        
-        return citations[:5]  # Limit to 5 citations
+                if len(citations) >= 5:  # Cap reached; skip remaining patterns
+                    return citations
+
+        return citations
     
     def _extract_memory_hits(self, response: str, context: ContextBundle) -> List[Dict[str, Any]]:
         """Extract memory hits from context"""
         memory_hits = []
-        
+
+        # Tokenize the response once; re-splitting it per memory made the
+        # scan O(K * |response|) for K memories
+        response_words = set(response.lower().split())
+
         # Check if response references context memories
         for memory_type, memories in context.memories.items():
             for memory in memories:
-                # Simple keyword matching
+                # Simple keyword matching against the response token set
                 memory_text = str(memory).lower()
-                response_lower = response.lower()
-                
-                # Check for overlap
-                memory_words = set(memory_text.split())
-                response_words = set(response_lower.split())
-                overlap = len(memory_words.intersection(response_words))
-                
+                overlap = sum(1 for word in set(memory_text.split()) if word in response_words)
+
                 if overlap > 2:  # Significant overlap
                     memory_hits.append({
                         'id': memory.get('id', 'unknown'),
@@ -211,8 +306,10 @@ Response:
                         'type': memory_type,
                         'content': memory_text[:100] + '...' if len(memory_text) > 100 else memory_text
                     })
-        
-        return memory_hits[:5]  # Limit to 5 memory hits
+                    if len(memory_hits) >= 5:  # Cap reached; stop scanning
+                        return memory_hits
+
+        return memory_hits
     
     def _format_memory_context(self, memories: Dict[str, List[Dict[str, Any]]]) -> str:
         """Format memory context for prompt"""
@@ -220,7 +317,7 @@ Response:
             return "No relevant memories found."
         
         context_parts = []
-        for memory_type, memory_list in memories.items():
+        for memory_type, memory_list in sorted(memories.items()):
             if memory_list:
                 context_parts.append(f"{memory_type.title()}: {len(memory_list)} items")
         
@@ -360,8 +457,15 @@ Provide balanced, fair, and constructive arbitration.
 
 
 class LocalReasonerFactory:
-    """Factory for creating local reasoners"""
-    
+    """Factory for creating local reasoners.
+
+    Reasoners carry no per-call mutable state (only their prompt template
+    and thresholds fixed at __init__), so the factory hands out one shared
+    instance per agent type instead of reallocating the long template
+    strings on every query. Subclasses must stay stateless for this to
+    remain safe across threads.
+    """
+
     _reasoners = {
         AgentType.LOGICAL: LogicalReasoner,
         AgentType.EMOTIONAL: EmotionalReasoner,
@@ -370,14 +474,21 @@ class LocalReasonerFactory:
         AgentType.VERIFIER: VerifierReasoner,
         AgentType.ARBITER: ArbiterReasoner
     }
-    
+    _instance_cache: Dict[AgentType, LocalReasoner] = {}
+    _lock = threading.Lock()
+
     @classmethod
     def create_reasoner(cls, agent_type: AgentType) -> LocalReasoner:
-        """Create a local reasoner of the specified type"""
+        """Return the shared reasoner of the specified type"""
         if agent_type not in cls._reasoners:
             raise ValueError(f"Unknown agent type: {agent_type}")
-        
-        return cls._reasoners[agent_type]()
+
+        with cls._lock:
+            instance = cls._instance_cache.get(agent_type)
+            if instance is None:
+                instance = cls._reasoners[agent_type]()
+                cls._instance_cache[agent_type] = instance
+            return instance
     
     @classmethod
     def create_reasoners(cls, agent_types: List[AgentType]) -> List[LocalReasoner]:
@@ -390,6 +501,20 @@ class LocalReasonerFactory:
         return list(cls._reasoners.keys())
 
 
+def _error_output(reasoner: LocalReasoner, error: Exception) -> AgentOutput:
+    """Build the zero-confidence placeholder for a failed reasoner."""
+    return AgentOutput(
+        agent=reasoner.agent_type,
+        text_draft=f"Error in {reasoner.agent_type.value} reasoning: {str(error)}",
+        reasoning_trace=[f"Error occurred: {str(error)}"],
+        confidence=0.0,
+        citations=[],
+        memory_hits=[],
+        iteration=0,
+        timestamp=datetime.now()
+    )
+
+
 class ParallelReasonerExecutor:
     """Executes multiple reasoners in parallel"""
     
@@ -429,55 +554,134 @@ class ParallelReasonerExecutor:
             except Exception as e:
                 reasoner = future_to_reasoner[future]
                 print(f"Error in {reasoner.agent_type.value} reasoner: {e}")
-                
-                # Create error result
-                error_result = AgentOutput(
-                    agent=reasoner.agent_type,
-                    text_draft=f"Error in {reasoner.agent_type.value} reasoning: {str(e)}",
-                    reasoning_trace=[f"Error occurred: {str(e)}"],
-                    confidence=0.0,
-                    citations=[],
-                    memory_hits=[],
-                    iteration=0,
-                    timestamp=datetime.now()
-                )
-                results.append(error_result)
+                results.append(_error_output(reasoner, e))
         
         return results
     
+    def execute_batched(self, reasoners: List[LocalReasoner],
+                        context: ContextBundle,
+                        neuromodulation_params: Dict[str, float] = None) -> List[AgentOutput]:
+        """Answer all reasoner prompts with a single provider call.
+
+        Bundles every role's prompt into one request and splits the
+        response on a separator, trading N network round-trips for one.
+        Correctness depends on the model honoring the separator, so a
+        malformed split falls back to per-reasoner parallel calls.
+        """
+        if neuromodulation_params is None:
+            neuromodulation_params = {}
+
+        sections = [
+            f"Role {i}:\n{reasoner._cached_prefix}{reasoner._dynamic_suffix(context, neuromodulation_params)}"
+            for i, reasoner in enumerate(reasoners, 1)
+        ]
+        prompt = (
+            f"Respond to each of the following {len(reasoners)} roles in order. "
+            f"Separate consecutive responses with a line containing exactly "
+            f"{_BATCH_SEP} and nothing else.\n\n"
+            + f"\n{_BATCH_SEP}\n".join(sections)
+        )
+
+        response = ask_gemini(prompt)
+        parts = [part.strip() for part in response.split(_BATCH_SEP)]
+        if len(parts) != len(reasoners):
+            print(f"Batched response split into {len(parts)} parts for "
+                  f"{len(reasoners)} reasoners; falling back to parallel calls")
+            return self.execute_parallel(reasoners, context, neuromodulation_params)
+
+        results = []
+        for reasoner, part in zip(reasoners, parts):
+            try:
+                results.append(reasoner._finalize(part, neuromodulation_params, context))
+            except Exception as e:
+                print(f"Error in {reasoner.agent_type.value} reasoner: {e}")
+                results.append(_error_output(reasoner, e))
+        return results
+
     def shutdown(self):
         """Shutdown the executor"""
         self.executor.shutdown(wait=True)
 
 
+# Lazily-created executor shared across suite calls; creating and
+# joining a fresh thread pool per query paid thread startup/teardown
+# on every fallback execution
+_GLOBAL_EXECUTOR: Optional[ParallelReasonerExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ParallelReasonerExecutor:
+    """Return the shared fallback executor, creating it on first use."""
+    global _GLOBAL_EXECUTOR
+    if _GLOBAL_EXECUTOR is None:
+        with _executor_lock:
+            if _GLOBAL_EXECUTOR is None:
+                _GLOBAL_EXECUTOR = ParallelReasonerExecutor()
+                atexit.register(_GLOBAL_EXECUTOR.shutdown)
+    return _GLOBAL_EXECUTOR
+
+
 def create_reasoner_suite() -> List[LocalReasoner]:
     """Create a complete suite of reasoners"""
     factory = LocalReasonerFactory()
     return factory.create_reasoners(factory.get_available_types())
 
 
-def execute_reasoner_suite(context: ContextBundle, 
+def execute_reasoner_suite(context: ContextBundle,
                           selected_types: List[AgentType] = None,
-                          neuromodulation_params: Dict[str, float] = None) -> List[AgentOutput]:
+                          neuromodulation_params: Dict[str, float] = None,
+                          batched: bool = False) -> List[AgentOutput]:
     """
     Execute a suite of reasoners on the given context
-    
+
     Args:
         context: Context bundle
         selected_types: Specific agent types to run (None for all)
         neuromodulation_params: Neuromodulator parameters
-        
+        batched: Bundle all prompts into one provider call (opt-in;
+            relies on the model honoring the response separator)
+
     Returns:
         List of AgentOutputs
     """
     if selected_types is None:
         selected_types = LocalReasonerFactory.get_available_types()
-    
+
     reasoners = [LocalReasonerFactory.create_reasoner(agent_type) for agent_type in selected_types]
-    executor = ParallelReasonerExecutor()
-    
-    try:
-        results = executor.execute_parallel(reasoners, context, neuromodulation_params)
-        return results
-    finally:
-        executor.shutdown()
+
+    if batched:
+        return _get_executor().execute_batched(reasoners, context, neuromodulation_params)
+
+    # Preferred path: all reasoners wait on sockets in one event loop,
+    # so suite latency collapses to the slowest single call without one
+    # OS thread per reasoner. Falls back to the thread pool when already
+    # inside an event loop (asyncio.run would fail) or httpx is missing.
+    if httpx is not None:
+        try:
+            return asyncio.run(
+                _execute_suite_async(reasoners, context, neuromodulation_params))
+        except RuntimeError:
+            pass
+
+    return _get_executor().execute_parallel(reasoners, context, neuromodulation_params)
+
+
+async def _execute_suite_async(reasoners: List[LocalReasoner],
+                               context: ContextBundle,
+                               neuromodulation_params: Dict[str, float] = None) -> List[AgentOutput]:
+    """Run all reasoners concurrently over a shared HTTP connection pool."""
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=16)) as client:
+        results = await asyncio.gather(
+            *(reasoner.run_async(context, neuromodulation_params, client=client)
+              for reasoner in reasoners),
+            return_exceptions=True
+        )
+
+    outputs = []
+    for reasoner, result in zip(reasoners, results):
+        if isinstance(result, Exception):
+            print(f"Error in {reasoner.agent_type.value} reasoner: {result}")
+            outputs.append(_error_output(reasoner, result))
+        else:
+            outputs.append(result)
+    return outputs
@@ -4,13 +4,43 @@ Logging configuration for RA9.
 This module provides structured logging with proper formatting and handlers.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Dict, Any
 import structlog
 from .config import get_config
 
+try:
+    import orjson
+
+    def _json_serializer(obj: Any, default=None, **_: Any) -> str:
+        # orjson serializes in C (2-5x stdlib json); decode since logging
+        # handlers expect str records
+        return orjson.dumps(obj, default=default).decode()
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    _json_serializer = None
+
+# setup_logging is called from several entry points (and repeatedly by
+# test suites); reconfiguring structlog and stacking duplicate handlers
+# on every call slows each subsequent log line
+_LOGGING_CONFIGURED = False
+
+# The processor chain is static apart from the renderer; build it once
+_BASE_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+)
+
 
 def setup_logging(
     log_level: Optional[str] = None,
@@ -18,38 +48,37 @@ def setup_logging(
     log_format: Optional[str] = None,
     enable_json: bool = False
 ) -> None:
-    """Setup structured logging for RA9."""
-    
+    """Setup structured logging for RA9. Idempotent after the first call."""
+
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+
     config = get_config()
-    
+
     # Use provided values or fall back to config
     level = log_level or config.log_level
     file_path = log_file or config.log_file
     format_str = log_format or config.log_format
-    
+
     # Configure structlog
-    processors = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-    ]
-    
+    processors = list(_BASE_PROCESSORS)
+
     if enable_json:
-        processors.append(structlog.processors.JSONRenderer())
+        if _json_serializer is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_json_serializer))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer())
-    
+
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.stdlib.BoundLogger,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-    
+
     # Configure standard logging
     logging.basicConfig(
         level=getattr(logging, level.upper()),
@@ -57,16 +86,48 @@ def setup_logging(
         handlers=_get_handlers(file_path)
     )
 
+    _LOGGING_CONFIGURED = True
+
+
+# Keeps the background listener alive for the process lifetime
+_LOG_LISTENER: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """atexit hook; tolerates a listener that was already stopped."""
+    listener = _LOG_LISTENER
+    if listener is not None and listener._thread is not None:
+        listener.stop()
+
 
 def _get_handlers(log_file: Optional[Path] = None) -> list:
-    """Get logging handlers."""
+    """Get logging handlers.
+
+    The real stream/file handlers run on a background QueueListener
+    thread, so hot-path log calls pay only an enqueue (~µs) instead of
+    blocking on stdout/disk writes.
+    """
+    global _LOG_LISTENER
+
     handlers = [logging.StreamHandler(sys.stdout)]
-    
+
     if log_file:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(log_file))
-    
-    return handlers
+        # Don't stack a second handler on a file the root logger already
+        # writes to
+        already_attached = any(
+            isinstance(h, logging.FileHandler) and h.baseFilename == str(log_file)
+            for h in logging.root.handlers
+        )
+        if not already_attached:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            handlers.append(logging.FileHandler(log_file))
+
+    log_queue = queue.Queue(-1)
+    _LOG_LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    atexit.register(_stop_listener)
+
+    return [QueueHandler(log_queue)]
 
 
 def get_logger(name: str) -> structlog.BoundLogger:
@@ -74,11 +135,31 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def _truncate(text: str, limit: int = 100) -> str:
+    """Clip long strings for log fields."""
+    return (text[:limit] + "...") if len(text) > limit else text
+
+
 class RA9Logger:
-    """RA9-specific logger with common patterns."""
-    
-    def __init__(self, name: str):
+    """RA9-specific logger with common patterns.
+
+    Static context is bound once — at construction or via for_agent —
+    so hot-path calls don't rebuild the same kwargs dict per event and
+    structlog doesn't reprocess immutable fields.
+    """
+
+    def __init__(self, name: str, **static_bindings: Any):
+        self.name = name
         self.logger = get_logger(name)
+        if static_bindings:
+            self.logger = self.logger.bind(**static_bindings)
+
+    def for_agent(self, agent_name: str) -> "RA9Logger":
+        """Return a logger with agent=agent_name pre-bound."""
+        bound = RA9Logger.__new__(RA9Logger)
+        bound.name = self.name
+        bound.logger = self.logger.bind(agent=agent_name)
+        return bound
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
@@ -100,19 +181,14 @@ class RA9Logger:
         """Log critical message."""
         self.logger.critical(message, **kwargs)
     
-    def agent_start(self, agent_name: str, query: str) -> None:
-        """Log agent start."""
-        self.logger.info(
-            "Agent started",
-            agent=agent_name,
-            query=query[:100] + "..." if len(query) > 100 else query
-        )
-    
-    def agent_complete(self, agent_name: str, result: Dict[str, Any]) -> None:
-        """Log agent completion."""
+    def agent_start(self, query: str) -> None:
+        """Log agent start. Bind the agent beforehand via for_agent."""
+        self.logger.info("Agent started", query=_truncate(query))
+
+    def agent_complete(self, result: Dict[str, Any]) -> None:
+        """Log agent completion. Bind the agent beforehand via for_agent."""
         self.logger.info(
             "Agent completed",
-            agent=agent_name,
             quality_score=result.get("quality_score", 0),
             iterations=result.get("iterations", 0)
         )
@@ -4,36 +4,293 @@ Implements cross-agent conflict detection and resolution
 """
 
 from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import count, islice
+import hashlib
 import json
 import re
+import threading
+
+import numpy as np
 
 from .schemas import AgentOutput, ConflictTicket, AgentType, BroadcastItem
 from .config import COHERENCE_THRESHOLD
 from ..tools.tool_api import ask_gemini
 
 
+# Conflict pattern vocabulary, compiled once at import; detector
+# instances share the compiled objects instead of carrying raw strings
+# that would need a re.compile (or regex-cache lookup) per use
+_RAW_PATTERNS = {
+    'contradiction': [
+        r'(\w+)\s+(?:is|are)\s+(?:not|never|no)\s+(\w+)',
+        r'(?:not|never|no)\s+(\w+)\s+(?:is|are)\s+(\w+)',
+        r'(\w+)\s+(?:contradicts|opposes|conflicts with)\s+(\w+)'
+    ],
+    'inconsistency': [
+        r'(?:however|but|although|despite)\s+',
+        r'(?:on the other hand|conversely|alternatively)',
+        r'(?:this contradicts|this conflicts with|this opposes)'
+    ],
+    'missing_evidence': [
+        r'(?:no evidence|insufficient evidence|lack of evidence)',
+        r'(?:unclear|unproven|speculative|assumption)',
+        r'(?:cannot be verified|cannot be confirmed)'
+    ]
+}
+_COMPILED_PATTERNS = {
+    kind: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for kind, patterns in _RAW_PATTERNS.items()
+}
+
+
+# Direct negations checked by _are_contradictory
+_NEGATION_PAIRS = (
+    ('is', 'is not'), ('are', 'are not'), ('can', 'cannot'),
+    ('will', 'will not'), ('should', 'should not'), ('must', 'must not')
+)
+
+# Opposite keywords checked by _are_contradictory
+_OPPOSITE_PAIRS = (
+    ('good', 'bad'), ('right', 'wrong'), ('true', 'false'),
+    ('correct', 'incorrect'), ('valid', 'invalid'), ('success', 'failure')
+)
+
+# Inconsistency indicators checked by _are_inconsistent
+_INCONSISTENCY_INDICATORS = (
+    'however', 'but', 'although', 'despite', 'on the other hand',
+    'conversely', 'alternatively', 'meanwhile', 'in contrast'
+)
+
+
+def _build_vocabulary_scanner() -> Tuple[Dict[str, Tuple[int, int, int, int, bool]], re.Pattern]:
+    """Compile the conflict vocabulary into one multi-pattern scanner.
+
+    Maps every vocabulary term to its mask contribution and compiles a
+    single alternation regex over all terms, so classifying a claim is
+    one linear pass of the C regex engine instead of ~24 substring scans.
+    Terms match only at word boundaries — 'is' no longer fires inside
+    'this', nor 'correct' inside 'incorrect'. The lookahead keeps
+    overlapping occurrences visible, and each term's contribution folds
+    in the bits of any shorter term it contains as a whole word (so
+    'is not' still implies 'is').
+    """
+    contributions: Dict[str, List[Any]] = {}
+
+    def _add(term: str, field: int, value: Any) -> None:
+        bits = contributions.setdefault(term, [0, 0, 0, 0, False])
+        if field == 4:
+            bits[4] = True
+        else:
+            bits[field] |= value
+
+    for bit, (positive, negative) in enumerate(_NEGATION_PAIRS):
+        _add(positive, 0, 1 << bit)
+        _add(negative, 1, 1 << bit)
+    for bit, (word1, word2) in enumerate(_OPPOSITE_PAIRS):
+        _add(word1, 2, 1 << bit)
+        _add(word2, 3, 1 << bit)
+    for indicator in _INCONSISTENCY_INDICATORS:
+        _add(indicator, 4, True)
+
+    merged = {}
+    for term, bits in contributions.items():
+        folded = list(bits)
+        for other, other_bits in contributions.items():
+            if other != term and re.search(r'\b' + re.escape(other) + r'\b', term):
+                folded[0] |= other_bits[0]
+                folded[1] |= other_bits[1]
+                folded[2] |= other_bits[2]
+                folded[3] |= other_bits[3]
+                folded[4] = folded[4] or other_bits[4]
+        merged[term] = tuple(folded)
+
+    alternation = '|'.join(
+        re.escape(term) for term in sorted(merged, key=len, reverse=True))
+    return merged, re.compile(r'(?=\b(' + alternation + r')\b)')
+
+
+_VOCAB_BITS, _VOCAB_RE = _build_vocabulary_scanner()
+
+
+# Process-wide ticket-id sequence; next() on a count is GIL-atomic and
+# avoids building a datetime object per ticket in the detector loop
+_CONFLICT_COUNTER = count()
+
+# f-strings can't contain a literal backslash before 3.12; join prompt
+# lines on this instead of re-evaluating chr(10) per call
+_NL = "\n"
+
+
+@lru_cache(maxsize=1024)
+def _render_output_line(agent_value: str, text_draft: str) -> str:
+    """Render one 'agent: draft' prompt line, reused across conflicts."""
+    return f"{agent_value}: {text_draft}"
+
+# Resolution prompt bodies, interpolated with %-formatting: the static
+# text (the bulk of each prompt) is allocated once at import and a
+# single substitution pass splices in the per-conflict parts
+_PROMPT_TEMPLATES = {
+    'contradiction': """
+You are an arbitration expert. Resolve the following contradiction between different perspectives.
+
+Conflict: %(description)s
+
+Conflicting outputs:
+%(outputs)s
+
+Resolution approach:
+1. Identify the core disagreement
+2. Find common ground or shared principles
+3. Propose a balanced resolution that acknowledges both perspectives
+4. Provide a synthesized response that addresses the contradiction
+
+Synthesized resolution:
+""",
+    'inconsistency': """
+You are a clarification expert. Resolve the following inconsistency between different perspectives.
+
+Inconsistency: %(description)s
+
+Conflicting outputs:
+%(outputs)s
+
+Resolution approach:
+1. Identify the specific inconsistency
+2. Clarify the relationship between the perspectives
+3. Show how they can coexist or complement each other
+4. Provide a clear, consistent synthesis
+
+Clarified synthesis:
+""",
+    'missing_evidence': """
+You are an evidence generation expert. Help strengthen the following claim with supporting evidence.
+
+Claim needing evidence: %(claim)s
+Agent: %(agent)s
+
+Evidence generation approach:
+1. Identify the key claims that need support
+2. Suggest specific types of evidence that would strengthen the argument
+3. Provide reasoning for why this evidence would be valuable
+4. Suggest how to find or generate this evidence
+
+Evidence suggestions:
+""",
+}
+
+
+
+def _scan_candidate_pairs(pos, neg, opp_a, opp_b, inconsistent, has_claims,
+                          has_evidence, agent_codes):
+    """Collect (i, j) pairs that can produce a ticket, as an int64 array.
+
+    Pure integer bitops over the per-output mask arrays; when numba is
+    installed the loop is compiled to native code and avoids
+    materializing the N x N candidate matrices the broadcast path
+    allocates.
+    """
+    n = pos.shape[0]
+    out = np.empty((n * (n - 1) // 2, 2), dtype=np.int64)
+    found = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if agent_codes[i] == agent_codes[j]:
+                continue
+            contradiction = (
+                (pos[i] & neg[j]) | (pos[j] & neg[i]) |
+                (opp_a[i] & opp_b[j]) | (opp_a[j] & opp_b[i])
+            )
+            inconsistency = (inconsistent[i] or inconsistent[j]) and has_claims[i] and has_claims[j]
+            missing = has_evidence[i] != has_evidence[j]
+            if contradiction != 0 or inconsistency or missing:
+                out[found, 0] = i
+                out[found, 1] = j
+                found += 1
+    return out[:found]
+
+
+try:  # Optional: compile the pair kernel when numba is installed
+    from numba import njit
+    _scan_candidate_pairs = njit(cache=True)(_scan_candidate_pairs)
+    _KERNEL_COMPILED = True
+except ImportError:
+    _KERNEL_COMPILED = False
+
+
+# The pairwise detector calls these helpers O(N^2) times over the same
+# drafts and claims; caching at module scope turns repeat comparisons
+# into dict hits. Tuples keep the claim lists hashable for reuse as keys.
+
+# Declarative-sentence pattern for claim extraction: skips hedging
+# openers and requires a minimally substantial clause ending in a
+# period. Claims may start only at the beginning of the draft or right
+# after a sentence terminator, so a hedged sentence is skipped as a
+# whole — without the anchor, finditer would retry one character past
+# the hedge word and extract a mid-word fragment ("owever the ...")
+_SENT_RE = re.compile(
+    r"(?:^|(?<=[.?!]))\s*(?!(?:however|although|despite)\b)([A-Z][^.?!]{10,}?)\.",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_claims_cached(text: str) -> Tuple[str, ...]:
+    """Extract key claims from text"""
+    # One C-level scan instead of split('.') plus per-sentence Python
+    # checks; islice caps at 5 key claims without walking the remainder
+    return tuple(match.group(1).strip() for match in islice(_SENT_RE.finditer(text), 5))
+
+
+@lru_cache(maxsize=8192)
+def _claim_masks(claim: str) -> Tuple[int, int, int, int, bool]:
+    """Bitmasks of which conflict-vocabulary terms appear in a claim.
+
+    Bit k of the first two masks marks the positive/negative side of
+    negation pair k; the next two masks do the same for opposite pair k.
+    The flag records inconsistency indicators. Two claims contradict iff
+    one's positive bits intersect the other's negative bits, which lets
+    the detector compare whole outputs with a few integer ANDs.
+    """
+    claim_lower = claim.lower()
+    pos = neg = opp_a = opp_b = 0
+    inconsistent = False
+    for match in _VOCAB_RE.finditer(claim_lower):
+        term_pos, term_neg, term_a, term_b, term_inc = _VOCAB_BITS[match.group(1)]
+        pos |= term_pos
+        neg |= term_neg
+        opp_a |= term_a
+        opp_b |= term_b
+        inconsistent = inconsistent or term_inc
+    return pos, neg, opp_a, opp_b, inconsistent
+
+
+@lru_cache(maxsize=8192)
+def _are_contradictory_cached(claim1: str, claim2: str) -> bool:
+    """Check if two claims are contradictory"""
+    # A negation/opposite pair spans the claims iff the positive bits of
+    # one intersect the negative bits of the other
+    pos1, neg1, opp_a1, opp_b1, _ = _claim_masks(claim1)
+    pos2, neg2, opp_a2, opp_b2, _ = _claim_masks(claim2)
+    return bool(
+        (pos1 & neg2) | (pos2 & neg1) | (opp_a1 & opp_b2) | (opp_a2 & opp_b1))
+
+
+@lru_cache(maxsize=8192)
+def _are_inconsistent_cached(claim1: str, claim2: str) -> bool:
+    """Check if two claims are inconsistent (but not directly contradictory)"""
+    # Inconsistent if either claim contains an inconsistency indicator
+    return _claim_masks(claim1)[4] or _claim_masks(claim2)[4]
+
+
 class ConflictDetector:
     """Detects conflicts between agent outputs"""
-    
+
     def __init__(self):
-        self.conflict_patterns = {
-            'contradiction': [
-                r'(\w+)\s+(?:is|are)\s+(?:not|never|no)\s+(\w+)',
-                r'(?:not|never|no)\s+(\w+)\s+(?:is|are)\s+(\w+)',
-                r'(\w+)\s+(?:contradicts|opposes|conflicts with)\s+(\w+)'
-            ],
-            'inconsistency': [
-                r'(?:however|but|although|despite)\s+',
-                r'(?:on the other hand|conversely|alternatively)',
-                r'(?:this contradicts|this conflicts with|this opposes)'
-            ],
-            'missing_evidence': [
-                r'(?:no evidence|insufficient evidence|lack of evidence)',
-                r'(?:unclear|unproven|speculative|assumption)',
-                r'(?:cannot be verified|cannot be confirmed)'
-            ]
-        }
+        self.conflict_patterns = _COMPILED_PATTERNS
     
     def detect_conflicts(self, agent_outputs: List[AgentOutput]) -> List[ConflictTicket]:
         """
@@ -45,266 +302,390 @@ class ConflictDetector:
         Returns:
             List of ConflictTickets
         """
+        n = len(agent_outputs)
+        if n < 2:
+            return []
+
+        # Outputs from a single agent can never conflict with each other
+        if len({output.agent for output in agent_outputs}) < 2:
+            return []
+
+        # Vectorized prefilter: fold each output's claim masks into one
+        # uint64 per vocabulary side, then find every candidate pair with
+        # a few broadcast bitwise ops instead of N^2 Python claim loops.
+        # The filters are exact (a nonzero AND of OR-folded masks means
+        # some claim pair shares a vocabulary bit), so only pairs that
+        # will actually produce a ticket reach the per-pair finders.
+        pos = np.zeros(n, dtype=np.uint64)
+        neg = np.zeros(n, dtype=np.uint64)
+        opp_a = np.zeros(n, dtype=np.uint64)
+        opp_b = np.zeros(n, dtype=np.uint64)
+        inconsistent = np.zeros(n, dtype=bool)
+        has_claims = np.zeros(n, dtype=bool)
+        has_evidence = np.zeros(n, dtype=bool)
+        agent_codes = np.empty(n, dtype=np.int64)
+        code_by_agent: Dict[AgentType, int] = {}
+
+        # Structure-of-arrays layout: claims and evidence flags are
+        # computed once per output here and handed to the pair finders by
+        # index, instead of being re-derived up to N-1 times in the scan
+        claims_by_idx: List[Tuple[str, ...]] = []
+
+        for idx, output in enumerate(agent_outputs):
+            claims = self._extract_claims(output.text_draft)
+            claims_by_idx.append(claims)
+            p = ng = a = b = 0
+            inc = False
+            for claim in claims:
+                cp, cn, ca, cb, ci = _claim_masks(claim)
+                p |= cp
+                ng |= cn
+                a |= ca
+                b |= cb
+                inc = inc or ci
+            pos[idx] = p
+            neg[idx] = ng
+            opp_a[idx] = a
+            opp_b[idx] = b
+            inconsistent[idx] = inc
+            has_claims[idx] = bool(claims)
+            has_evidence[idx] = bool(output.citations) or bool(output.memory_hits)
+            agent_codes[idx] = code_by_agent.setdefault(output.agent, len(code_by_agent))
+
+        if _KERNEL_COMPILED:
+            pair_array = _scan_candidate_pairs(
+                pos, neg, opp_a, opp_b, inconsistent, has_claims,
+                has_evidence, agent_codes)
+        else:
+            contradiction = (
+                (pos[:, None] & neg[None, :]) | (pos[None, :] & neg[:, None]) |
+                (opp_a[:, None] & opp_b[None, :]) | (opp_a[None, :] & opp_b[:, None])
+            ) != 0
+            inconsistency = (
+                (inconsistent[:, None] | inconsistent[None, :]) &
+                (has_claims[:, None] & has_claims[None, :])
+            )
+            missing_evidence = has_evidence[:, None] != has_evidence[None, :]
+
+            candidates = contradiction | inconsistency | missing_evidence
+            candidates &= agent_codes[:, None] != agent_codes[None, :]
+            pair_array = np.argwhere(np.triu(candidates, k=1))
+
+        pairs = [(int(i), int(j)) for i, j in pair_array]
+
+        # For large output sets the remaining string comparisons dominate;
+        # they are read-only per pair, so fan them out across threads.
+        # Below the gate the executor overhead outweighs the work and the
+        # serial path can skip used agents before comparing at all.
+        compared = None
+        if len(agent_outputs) >= 8 and len(pairs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+                compared = list(executor.map(
+                    lambda pair: self._classify_pair(
+                        pair[0], pair[1], agent_outputs, claims_by_idx, has_evidence),
+                    pairs
+                ))
+
+        # Accept only the earliest conflict per agent so the ticket list
+        # covers disjoint agent sets; overlapping tickets for one agent
+        # would each trigger a redundant resolution round-trip downstream.
+        # Tickets are only allocated for accepted survivors — the scan
+        # itself traffics in lightweight (kind, claim, claim) tuples
         conflicts = []
-        
-        # Compare each pair of outputs
-        for i, output1 in enumerate(agent_outputs):
-            for j, output2 in enumerate(agent_outputs[i+1:], i+1):
-                conflict = self._compare_outputs(output1, output2)
-                if conflict:
-                    conflicts.append(conflict)
-        
+        used_agents = set()
+        for idx, (i, j) in enumerate(pairs):
+            output1, output2 = agent_outputs[i], agent_outputs[j]
+            if output1.agent in used_agents or output2.agent in used_agents:
+                continue
+            found = compared[idx] if compared is not None else self._classify_pair(
+                i, j, agent_outputs, claims_by_idx, has_evidence)
+            if found:
+                conflicts.append(self._build_ticket(found, output1, output2, bool(has_evidence[i])))
+                used_agents.add(output1.agent)
+                used_agents.add(output2.agent)
+
         return conflicts
     
-    def _compare_outputs(self, output1: AgentOutput, output2: AgentOutput) -> Optional[ConflictTicket]:
-        """Compare two outputs for conflicts"""
-        # Skip if same agent
-        if output1.agent == output2.agent:
+    def _classify_pair(self, i: int, j: int, agent_outputs: List[AgentOutput],
+                       claims_by_idx: List[Tuple[str, ...]],
+                       has_evidence: List[bool]) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """Classify a candidate pair as a (kind, claim1, claim2) tuple, or None.
+
+        Allocation-light stand-in for ticket construction: the pair scan
+        runs over many candidates, most of which the disjoint-agent
+        filter discards, so full ConflictTicket objects are only built
+        for the survivors.
+        """
+        output1, output2 = agent_outputs[i], agent_outputs[j]
+
+        # Skip if same agent (identity check — enum members are singletons)
+        if output1.agent is output2.agent:
             return None
-        
-        # Extract key claims from both outputs
-        claims1 = self._extract_claims(output1.text_draft)
-        claims2 = self._extract_claims(output2.text_draft)
-        
+
+        claims1 = claims_by_idx[i]
+        claims2 = claims_by_idx[j]
+
         # Check for contradictions
-        contradiction = self._find_contradiction(claims1, claims2, output1.agent, output2.agent)
-        if contradiction:
-            return contradiction
-        
-        # Check for inconsistencies
-        inconsistency = self._find_inconsistency(claims1, claims2, output1.agent, output2.agent)
-        if inconsistency:
-            return inconsistency
-        
-        # Check for missing evidence
-        missing_evidence = self._find_missing_evidence(output1, output2)
-        if missing_evidence:
-            return missing_evidence
-        
-        return None
-    
-    def _extract_claims(self, text: str) -> List[str]:
-        """Extract key claims from text"""
-        # Simple claim extraction - look for declarative statements
-        sentences = text.split('.')
-        claims = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if (sentence and 
-                not sentence.startswith(('?', '!')) and
-                len(sentence.split()) > 3 and
-                not sentence.startswith(('however', 'although', 'despite'))):
-                claims.append(sentence)
-        
-        return claims[:5]  # Limit to 5 key claims
-    
-    def _find_contradiction(self, claims1: List[str], claims2: List[str], 
-                          agent1: AgentType, agent2: AgentType) -> Optional[ConflictTicket]:
-        """Find direct contradictions between claims"""
         for claim1 in claims1:
             for claim2 in claims2:
                 if self._are_contradictory(claim1, claim2):
-                    return ConflictTicket(
-                        conflict_id=f"contradiction_{agent1.value}_{agent2.value}_{datetime.now().timestamp()}",
-                        conflicting_agents=[agent1, agent2],
-                        conflict_type="contradiction",
-                        description=f"Contradiction between {agent1.value} and {agent2.value}",
-                        severity=0.8,
-                        suggested_resolution=f"Reconcile conflicting claims: '{claim1}' vs '{claim2}'"
-                    )
-        
-        return None
-    
-    def _find_inconsistency(self, claims1: List[str], claims2: List[str],
-                          agent1: AgentType, agent2: AgentType) -> Optional[ConflictTicket]:
-        """Find inconsistencies between claims"""
+                    return ('contradiction', claim1, claim2)
+
+        # Check for inconsistencies
         for claim1 in claims1:
             for claim2 in claims2:
                 if self._are_inconsistent(claim1, claim2):
-                    return ConflictTicket(
-                        conflict_id=f"inconsistency_{agent1.value}_{agent2.value}_{datetime.now().timestamp()}",
-                        conflicting_agents=[agent1, agent2],
-                        conflict_type="inconsistency",
-                        description=f"Inconsistency between {agent1.value} and {agent2.value}",
-                        severity=0.6,
-                        suggested_resolution=f"Clarify relationship between: '{claim1}' and '{claim2}'"
-                    )
-        
+                    return ('inconsistency', claim1, claim2)
+
+        # Check for missing evidence
+        if bool(has_evidence[i]) != bool(has_evidence[j]):
+            return ('missing_evidence', None, None)
+
         return None
-    
-    def _find_missing_evidence(self, output1: AgentOutput, output2: AgentOutput) -> Optional[ConflictTicket]:
-        """Find cases where evidence is missing"""
-        # Check if one output has evidence and the other doesn't
-        has_evidence1 = len(output1.citations) > 0 or len(output1.memory_hits) > 0
-        has_evidence2 = len(output2.citations) > 0 or len(output2.memory_hits) > 0
-        
-        if has_evidence1 and not has_evidence2:
+
+    def _build_ticket(self, found: Tuple[str, Optional[str], Optional[str]],
+                      output1: AgentOutput, output2: AgentOutput,
+                      has_evidence1: bool) -> ConflictTicket:
+        """Materialize a ConflictTicket for an accepted classification."""
+        kind, claim1, claim2 = found
+        agent1, agent2 = output1.agent, output2.agent
+
+        if kind == 'contradiction':
             return ConflictTicket(
-                conflict_id=f"missing_evidence_{output2.agent.value}_{datetime.now().timestamp()}",
-                conflicting_agents=[output1.agent, output2.agent],
-                conflict_type="missing_evidence",
-                description=f"{output2.agent.value} lacks supporting evidence",
-                severity=0.4,
-                suggested_resolution=f"Provide evidence for {output2.agent.value} claims"
+                conflict_id=f"contradiction_{agent1.value}_{agent2.value}_{next(_CONFLICT_COUNTER)}",
+                conflicting_agents=[agent1, agent2],
+                conflict_type="contradiction",
+                description=f"Contradiction between {agent1.value} and {agent2.value}",
+                severity=0.8,
+                suggested_resolution=f"Reconcile conflicting claims: '{claim1}' vs '{claim2}'"
             )
-        elif has_evidence2 and not has_evidence1:
+        if kind == 'inconsistency':
             return ConflictTicket(
-                conflict_id=f"missing_evidence_{output1.agent.value}_{datetime.now().timestamp()}",
-                conflicting_agents=[output1.agent, output2.agent],
-                conflict_type="missing_evidence",
-                description=f"{output1.agent.value} lacks supporting evidence",
-                severity=0.4,
-                suggested_resolution=f"Provide evidence for {output1.agent.value} claims"
+                conflict_id=f"inconsistency_{agent1.value}_{agent2.value}_{next(_CONFLICT_COUNTER)}",
+                conflicting_agents=[agent1, agent2],
+                conflict_type="inconsistency",
+                description=f"Inconsistency between {agent1.value} and {agent2.value}",
+                severity=0.6,
+                suggested_resolution=f"Clarify relationship between: '{claim1}' and '{claim2}'"
             )
-        
-        return None
+
+        # missing_evidence: the ticket names whichever side lacks evidence
+        lacking = output2 if has_evidence1 else output1
+        return ConflictTicket(
+            conflict_id=f"missing_evidence_{lacking.agent.value}_{next(_CONFLICT_COUNTER)}",
+            conflicting_agents=[agent1, agent2],
+            conflict_type="missing_evidence",
+            description=f"{lacking.agent.value} lacks supporting evidence",
+            severity=0.4,
+            suggested_resolution=f"Provide evidence for {lacking.agent.value} claims"
+        )
+
+    def _extract_claims(self, text: str) -> Tuple[str, ...]:
+        """Extract key claims from text"""
+        return _extract_claims_cached(text)
     
     def _are_contradictory(self, claim1: str, claim2: str) -> bool:
         """Check if two claims are contradictory"""
-        # Simple contradiction detection
-        claim1_lower = claim1.lower()
-        claim2_lower = claim2.lower()
-        
-        # Check for direct negations
-        negation_pairs = [
-            ('is', 'is not'), ('are', 'are not'), ('can', 'cannot'),
-            ('will', 'will not'), ('should', 'should not'), ('must', 'must not')
-        ]
-        
-        for positive, negative in negation_pairs:
-            if positive in claim1_lower and negative in claim2_lower:
-                return True
-            if positive in claim2_lower and negative in claim1_lower:
-                return True
-        
-        # Check for opposite keywords
-        opposite_pairs = [
-            ('good', 'bad'), ('right', 'wrong'), ('true', 'false'),
-            ('correct', 'incorrect'), ('valid', 'invalid'), ('success', 'failure')
-        ]
-        
-        for word1, word2 in opposite_pairs:
-            if word1 in claim1_lower and word2 in claim2_lower:
-                return True
-            if word1 in claim2_lower and word2 in claim1_lower:
-                return True
-        
-        return False
-    
+        # The check is symmetric; normalize argument order so (A, B) and
+        # (B, A) share one cache entry
+        if claim1 > claim2:
+            claim1, claim2 = claim2, claim1
+        return _are_contradictory_cached(claim1, claim2)
+
     def _are_inconsistent(self, claim1: str, claim2: str) -> bool:
         """Check if two claims are inconsistent (but not directly contradictory)"""
-        # Look for inconsistency indicators
-        inconsistency_indicators = [
-            'however', 'but', 'although', 'despite', 'on the other hand',
-            'conversely', 'alternatively', 'meanwhile', 'in contrast'
-        ]
-        
-        claim1_lower = claim1.lower()
-        claim2_lower = claim2.lower()
-        
-        # Check if either claim contains inconsistency indicators
-        for indicator in inconsistency_indicators:
-            if indicator in claim1_lower or indicator in claim2_lower:
-                return True
-        
-        return False
+        if claim1 > claim2:
+            claim1, claim2 = claim2, claim1
+        return _are_inconsistent_cached(claim1, claim2)
 
 
 class ConflictResolver:
     """Resolves conflicts between agent outputs"""
-    
+
+    # Bound on the prompt-keyed resolution cache
+    _CACHE_MAX = 512
+
     def __init__(self):
         self.resolution_strategies = {
             'contradiction': self._resolve_contradiction,
             'inconsistency': self._resolve_inconsistency,
             'missing_evidence': self._resolve_missing_evidence
         }
-    
-    def resolve_conflict(self, conflict: ConflictTicket, agent_outputs: List[AgentOutput]) -> Dict[str, Any]:
+        # Prompts are deterministic in the conflict and drafts, so
+        # identical inputs would repeat the same Gemini round-trip;
+        # fingerprint the prompt and replay the cached resolution instead.
+        # The lock covers cache bookkeeping only — resolutions run on the
+        # analyze_coherence thread pool
+        self._resolution_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _resolve_with_llm(self, prompt: str, conflict: ConflictTicket,
+                          result_type: str, strategy: str, confidence: float) -> Dict[str, Any]:
+        """Run a resolution prompt through Gemini, replaying cached results."""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        with self._cache_lock:
+            cached = self._resolution_cache.get(key)
+            if cached is not None:
+                self._resolution_cache.move_to_end(key)
+                replay = dict(cached)
+                replay['conflict_id'] = conflict.conflict_id
+                return replay
+
+        result = {
+            'type': result_type,
+            'conflict_id': conflict.conflict_id,
+            'resolution': ask_gemini(prompt),
+            'strategy': strategy,
+            'confidence': confidence
+        }
+
+        with self._cache_lock:
+            self._resolution_cache[key] = result
+            self._resolution_cache.move_to_end(key)
+            while len(self._resolution_cache) > self._CACHE_MAX:
+                self._resolution_cache.popitem(last=False)
+
+        return result
+
+    # Per-type result metadata, shared by the batched path and the
+    # strategy methods' fallbacks
+    _RESOLUTION_DEFAULTS = {
+        'contradiction': ('contradiction_resolution', 'arbitration', 0.7),
+        'inconsistency': ('inconsistency_resolution', 'clarification', 0.8),
+        'missing_evidence': ('evidence_resolution', 'evidence_generation', 0.6),
+    }
+
+    def resolve_conflicts(self, conflicts: List[ConflictTicket],
+                          agent_index: Dict[AgentType, AgentOutput]) -> List[Dict[str, Any]]:
+        """
+        Resolve several conflicts with a single batched Gemini call
+
+        K conflicts used to cost K round-trips; one prompt asking for a
+        JSON array of resolutions amortizes the network and model setup
+        across the batch. Falls back to per-conflict resolution (fanned
+        out across threads) when the reply does not parse as expected.
+
+        Args:
+            conflicts: ConflictTickets to resolve, in order
+            agent_index: Mapping from agent to its output
+
+        Returns:
+            Resolution results aligned with the conflicts
+        """
+        if not conflicts:
+            return []
+        if len(conflicts) == 1:
+            return [self.resolve_conflict(conflicts[0], agent_index)]
+
+        sections = []
+        for index, conflict in enumerate(conflicts, 1):
+            conflicting_outputs = [agent_index[agent] for agent in conflict.conflicting_agents]
+            rendered = _NL.join(
+                _render_output_line(output.agent.value, output.text_draft)
+                for output in conflicting_outputs)
+            sections.append(
+                f"Conflict {index} ({conflict.conflict_type}): {conflict.description}\n"
+                f"Conflicting outputs:\n{rendered}"
+            )
+
+        prompt = f"""
+You are a conflict-resolution expert. Resolve each of the following {len(conflicts)} conflicts between different perspectives.
+
+{_NL.join(sections)}
+
+For each conflict, in order, produce a JSON object with keys "resolution" (the synthesized resolution text), "strategy", and "confidence" (0.0-1.0).
+Return ONLY a JSON array of exactly {len(conflicts)} such objects, with no other text.
+"""
+
+        reply = ask_gemini(prompt)
+        parsed = self._parse_batched_reply(reply, len(conflicts))
+        if parsed is None:
+            return self._resolve_individually(conflicts, agent_index)
+
+        results = []
+        for conflict, item in zip(conflicts, parsed):
+            result_type, strategy, confidence = self._RESOLUTION_DEFAULTS.get(
+                conflict.conflict_type, ('generic_resolution', 'generic', 0.5))
+            raw_confidence = item.get('confidence')
+            if not isinstance(raw_confidence, (int, float)):
+                raw_confidence = confidence
+            results.append({
+                'type': result_type,
+                'conflict_id': conflict.conflict_id,
+                'resolution': str(item.get('resolution', '')),
+                'strategy': str(item.get('strategy', strategy)),
+                'confidence': max(0.0, min(1.0, float(raw_confidence)))
+            })
+        return results
+
+    @staticmethod
+    def _parse_batched_reply(reply: str, expected: int) -> Optional[List[Dict[str, Any]]]:
+        """Parse the batched reply into a list of dicts, or None on mismatch."""
+        start = reply.find('[')
+        end = reply.rfind(']')
+        if start == -1 or end <= start:
+            return None
+        try:
+            parsed = json.loads(reply[start:end + 1])
+        except ValueError:
+            return None
+        if (not isinstance(parsed, list) or len(parsed) != expected or
+                not all(isinstance(item, dict) for item in parsed)):
+            return None
+        return parsed
+
+    def _resolve_individually(self, conflicts: List[ConflictTicket],
+                              agent_index: Dict[AgentType, AgentOutput]) -> List[Dict[str, Any]]:
+        """Per-conflict fallback: independent Gemini calls fanned out across threads."""
+        with ThreadPoolExecutor(max_workers=min(8, len(conflicts))) as executor:
+            return list(executor.map(
+                lambda conflict: self.resolve_conflict(conflict, agent_index),
+                conflicts
+            ))
+
+    def resolve_conflict(self, conflict: ConflictTicket, agent_index: Dict[AgentType, AgentOutput]) -> Dict[str, Any]:
         """
         Resolve a conflict between agent outputs
         
         Args:
             conflict: ConflictTicket to resolve
-            agent_outputs: List of all agent outputs
+            agent_index: Mapping from agent to its output
             
         Returns:
             Resolution result with synthesized output
         """
         strategy = self.resolution_strategies.get(conflict.conflict_type, self._resolve_generic)
-        return strategy(conflict, agent_outputs)
+        return strategy(conflict, agent_index)
     
-    def _resolve_contradiction(self, conflict: ConflictTicket, agent_outputs: List[AgentOutput]) -> Dict[str, Any]:
+    def _resolve_contradiction(self, conflict: ConflictTicket, agent_index: Dict[AgentType, AgentOutput]) -> Dict[str, Any]:
         """Resolve contradiction conflicts"""
-        conflicting_outputs = [output for output in agent_outputs 
-                             if output.agent in conflict.conflicting_agents]
+        conflicting_outputs = [agent_index[agent] for agent in conflict.conflicting_agents]
         
         # Use arbitration prompt to resolve contradiction
-        prompt = f"""
-You are an arbitration expert. Resolve the following contradiction between different perspectives.
-
-Conflict: {conflict.description}
-
-Conflicting outputs:
-{chr(10).join(f"{output.agent.value}: {output.text_draft}" for output in conflicting_outputs)}
-
-Resolution approach:
-1. Identify the core disagreement
-2. Find common ground or shared principles
-3. Propose a balanced resolution that acknowledges both perspectives
-4. Provide a synthesized response that addresses the contradiction
-
-Synthesized resolution:
-"""
-        
-        resolution = ask_gemini(prompt)
-        
-        return {
-            'type': 'contradiction_resolution',
-            'conflict_id': conflict.conflict_id,
-            'resolution': resolution,
-            'strategy': 'arbitration',
-            'confidence': 0.7
+        prompt = _PROMPT_TEMPLATES['contradiction'] % {
+            'description': conflict.description,
+            'outputs': _NL.join(_render_output_line(output.agent.value, output.text_draft)
+                                for output in conflicting_outputs)
         }
+
+        return self._resolve_with_llm(prompt, conflict, 'contradiction_resolution', 'arbitration', 0.7)
     
-    def _resolve_inconsistency(self, conflict: ConflictTicket, agent_outputs: List[AgentOutput]) -> Dict[str, Any]:
+    def _resolve_inconsistency(self, conflict: ConflictTicket, agent_index: Dict[AgentType, AgentOutput]) -> Dict[str, Any]:
         """Resolve inconsistency conflicts"""
-        conflicting_outputs = [output for output in agent_outputs 
-                             if output.agent in conflict.conflicting_agents]
+        conflicting_outputs = [agent_index[agent] for agent in conflict.conflicting_agents]
         
         # Use clarification prompt to resolve inconsistency
-        prompt = f"""
-You are a clarification expert. Resolve the following inconsistency between different perspectives.
-
-Inconsistency: {conflict.description}
-
-Conflicting outputs:
-{chr(10).join(f"{output.agent.value}: {output.text_draft}" for output in conflicting_outputs)}
-
-Resolution approach:
-1. Identify the specific inconsistency
-2. Clarify the relationship between the perspectives
-3. Show how they can coexist or complement each other
-4. Provide a clear, consistent synthesis
-
-Clarified synthesis:
-"""
-        
-        resolution = ask_gemini(prompt)
-        
-        return {
-            'type': 'inconsistency_resolution',
-            'conflict_id': conflict.conflict_id,
-            'resolution': resolution,
-            'strategy': 'clarification',
-            'confidence': 0.8
+        prompt = _PROMPT_TEMPLATES['inconsistency'] % {
+            'description': conflict.description,
+            'outputs': _NL.join(_render_output_line(output.agent.value, output.text_draft)
+                                for output in conflicting_outputs)
         }
+
+        return self._resolve_with_llm(prompt, conflict, 'inconsistency_resolution', 'clarification', 0.8)
     
-    def _resolve_missing_evidence(self, conflict: ConflictTicket, agent_outputs: List[AgentOutput]) -> Dict[str, Any]:
+    def _resolve_missing_evidence(self, conflict: ConflictTicket, agent_index: Dict[AgentType, AgentOutput]) -> Dict[str, Any]:
         """Resolve missing evidence conflicts"""
-        conflicting_outputs = [output for output in agent_outputs 
-                             if output.agent in conflict.conflicting_agents]
+        conflicting_outputs = [agent_index[agent] for agent in conflict.conflicting_agents]
         
         # Identify which output needs evidence
         needs_evidence = None
@@ -317,32 +698,14 @@ Clarified synthesis:
             return {'type': 'no_resolution_needed', 'confidence': 1.0}
         
         # Use evidence generation prompt
-        prompt = f"""
-You are an evidence generation expert. Help strengthen the following claim with supporting evidence.
-
-Claim needing evidence: {needs_evidence.text_draft}
-Agent: {needs_evidence.agent.value}
-
-Evidence generation approach:
-1. Identify the key claims that need support
-2. Suggest specific types of evidence that would strengthen the argument
-3. Provide reasoning for why this evidence would be valuable
-4. Suggest how to find or generate this evidence
-
-Evidence suggestions:
-"""
-        
-        evidence_suggestions = ask_gemini(prompt)
-        
-        return {
-            'type': 'evidence_resolution',
-            'conflict_id': conflict.conflict_id,
-            'resolution': evidence_suggestions,
-            'strategy': 'evidence_generation',
-            'confidence': 0.6
+        prompt = _PROMPT_TEMPLATES['missing_evidence'] % {
+            'claim': needs_evidence.text_draft,
+            'agent': needs_evidence.agent.value
         }
+
+        return self._resolve_with_llm(prompt, conflict, 'evidence_resolution', 'evidence_generation', 0.6)
     
-    def _resolve_generic(self, conflict: ConflictTicket, agent_outputs: List[AgentOutput]) -> Dict[str, Any]:
+    def _resolve_generic(self, conflict: ConflictTicket, agent_index: Dict[AgentType, AgentOutput]) -> Dict[str, Any]:
         """Generic conflict resolution"""
         return {
             'type': 'generic_resolution',
@@ -359,7 +722,13 @@ class MetaCoherenceEngine:
     def __init__(self):
         self.conflict_detector = ConflictDetector()
         self.conflict_resolver = ConflictResolver()
-        self.coherence_history = []
+        # Ring buffer: the maxlen evicts the oldest record in O(1)
+        # instead of reslicing a list on every overflow
+        self.coherence_history = deque(maxlen=1000)
+        # Running aggregates over the buffer, maintained on record so
+        # get_coherence_stats is O(1) instead of rescanning the history
+        self._score_sum = 0.0
+        self._conflict_any_count = 0
     
     def analyze_coherence(self, agent_outputs: List[AgentOutput]) -> Dict[str, Any]:
         """
@@ -377,12 +746,12 @@ class MetaCoherenceEngine:
         # Calculate coherence score
         coherence_score = self._calculate_coherence_score(agent_outputs, conflicts)
         
-        # Resolve conflicts if any
-        resolutions = []
-        if conflicts:
-            for conflict in conflicts:
-                resolution = self.conflict_resolver.resolve_conflict(conflict, agent_outputs)
-                resolutions.append(resolution)
+        # Resolve conflicts if any: one batched Gemini call for the whole
+        # set, with a threaded per-conflict fallback inside the resolver.
+        # The agent index is built once so the resolver does dict lookups
+        # instead of rescanning the output list per conflict
+        agent_index = {output.agent: output for output in agent_outputs}
+        resolutions = self.conflict_resolver.resolve_conflicts(conflicts, agent_index)
         
         # Record analysis
         self._record_coherence_analysis(agent_outputs, conflicts, resolutions, coherence_score)
@@ -433,11 +802,18 @@ class MetaCoherenceEngine:
             'agent_types': [output.agent.value for output in agent_outputs]
         }
         
+        # Peek before appending: at maxlen the append evicts the oldest
+        # record, whose contribution must leave the running aggregates
+        if len(self.coherence_history) == self.coherence_history.maxlen:
+            outgoing = self.coherence_history[0]
+            self._score_sum -= outgoing['coherence_score']
+            if outgoing['conflict_count'] > 0:
+                self._conflict_any_count -= 1
+
         self.coherence_history.append(record)
-        
-        # Keep only recent history (last 1000 analyses)
-        if len(self.coherence_history) > 1000:
-            self.coherence_history = self.coherence_history[-1000:]
+        self._score_sum += coherence_score
+        if conflicts:
+            self._conflict_any_count += 1
     
     def get_coherence_stats(self) -> Dict[str, Any]:
         """Get coherence analysis statistics"""
@@ -445,8 +821,8 @@ class MetaCoherenceEngine:
             return {'total_analyses': 0, 'avg_coherence': 0.0, 'conflict_rate': 0.0}
         
         total_analyses = len(self.coherence_history)
-        avg_coherence = sum(record['coherence_score'] for record in self.coherence_history) / total_analyses
-        conflict_rate = sum(1 for record in self.coherence_history if record['conflict_count'] > 0) / total_analyses
+        avg_coherence = self._score_sum / total_analyses
+        conflict_rate = self._conflict_any_count / total_analyses
         
         return {
             'total_analyses': total_analyses,
@@ -457,10 +833,12 @@ class MetaCoherenceEngine:
     
     def _calculate_recent_coherence(self, window: int = 100) -> float:
         """Calculate recent coherence score"""
-        recent_analyses = self.coherence_history[-window:]
+        # Deques don't support negative slicing; walk the newest records
+        # from the right instead
+        recent_analyses = list(islice(reversed(self.coherence_history), window))
         if not recent_analyses:
             return 0.0
-        
+
         return sum(record['coherence_score'] for record in recent_analyses) / len(recent_analyses)
 
 
@@ -3,7 +3,8 @@ Neuromodulation Controller - Global scalar modulators analogue
 Manages attention, exploration, and reward signals that modulate system behavior
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from dataclasses import replace
 from datetime import datetime, timedelta
 import threading
 import json
@@ -19,9 +20,14 @@ class NeuromodulationController:
     """
     
     def __init__(self):
-        self.state = NeuromodulatorState()
-        self.lock = threading.RLock()
-        self.update_callbacks: List[Callable[[NeuromodulatorState], None]] = []
+        # Lock-free read path: the current state is an immutable snapshot
+        # published by reference assignment (atomic under the GIL), so
+        # readers never take a lock. Writers serialize on _write_lock;
+        # concurrent feedback sequences are last-writer-wins, which is
+        # acceptable for intrinsically noisy scalar modulators.
+        self._state = NeuromodulatorState()
+        self._write_lock = threading.Lock()
+        self.update_callbacks: Tuple[Callable[[NeuromodulatorState], None], ...] = ()
         
         # Learning parameters
         self.learning_rate = 0.01
@@ -37,16 +43,15 @@ class NeuromodulationController:
             'reward_signal': {'min': -1.0, 'max': 1.0, 'target': 0.0}
         }
     
+    @property
+    def state(self) -> NeuromodulatorState:
+        """Latest published snapshot (immutable)"""
+        return self._state
+
     def get_state(self) -> NeuromodulatorState:
         """Get current neuromodulator state"""
-        with self.lock:
-            self._apply_decay()
-            return NeuromodulatorState(
-                attention_gain=self.state.attention_gain,
-                explore_noise=self.state.explore_noise,
-                reward_signal=self.state.reward_signal,
-                timestamp=datetime.now()
-            )
+        # One reference load plus pure decay arithmetic; no lock
+        return self._decayed(self._state)
     
     def update_attention_gain(self, delta: float, reason: str = "") -> None:
         """
@@ -56,15 +61,7 @@ class NeuromodulationController:
             delta: Change in attention gain (-1.0 to 1.0)
             reason: Reason for the update
         """
-        with self.lock:
-            old_value = self.state.attention_gain
-            self.state.attention_gain = self._clamp_value(
-                self.state.attention_gain + delta,
-                self.adaptive_thresholds['attention_gain']
-            )
-            
-            self._record_update('attention_gain', old_value, self.state.attention_gain, reason)
-            self._notify_callbacks()
+        self._publish_update('attention_gain', delta, reason)
     
     def update_explore_noise(self, delta: float, reason: str = "") -> None:
         """
@@ -74,15 +71,7 @@ class NeuromodulationController:
             delta: Change in exploration noise (-1.0 to 1.0)
             reason: Reason for the update
         """
-        with self.lock:
-            old_value = self.state.explore_noise
-            self.state.explore_noise = self._clamp_value(
-                self.state.explore_noise + delta,
-                self.adaptive_thresholds['explore_noise']
-            )
-            
-            self._record_update('explore_noise', old_value, self.state.explore_noise, reason)
-            self._notify_callbacks()
+        self._publish_update('explore_noise', delta, reason)
     
     def update_reward_signal(self, delta: float, reason: str = "") -> None:
         """
@@ -92,15 +81,18 @@ class NeuromodulationController:
             delta: Change in reward signal (-1.0 to 1.0)
             reason: Reason for the update
         """
-        with self.lock:
-            old_value = self.state.reward_signal
-            self.state.reward_signal = self._clamp_value(
-                self.state.reward_signal + delta,
-                self.adaptive_thresholds['reward_signal']
-            )
-            
-            self._record_update('reward_signal', old_value, self.state.reward_signal, reason)
-            self._notify_callbacks()
+        self._publish_update('reward_signal', delta, reason)
+
+    def _publish_update(self, modulator: str, delta: float, reason: str) -> None:
+        """Apply a clamped delta to one modulator and publish a new snapshot"""
+        with self._write_lock:
+            current = self._decayed(self._state)
+            old_value = getattr(current, modulator)
+            new_value = self._clamp_value(
+                old_value + delta, self.adaptive_thresholds[modulator])
+            self._state = replace(current, **{modulator: new_value})
+            self._record_update(modulator, old_value, new_value, reason)
+        self._notify_callbacks()
     
     def process_feedback(self, feedback_type: str, value: float, context: Dict[str, Any] = None) -> None:
         """
@@ -113,20 +105,22 @@ class NeuromodulationController:
         """
         if context is None:
             context = {}
-        
-        with self.lock:
-            if feedback_type == 'success':
-                self._handle_success_feedback(value, context)
-            elif feedback_type == 'failure':
-                self._handle_failure_feedback(value, context)
-            elif feedback_type == 'uncertainty':
-                self._handle_uncertainty_feedback(value, context)
-            elif feedback_type == 'novelty':
-                self._handle_novelty_feedback(value, context)
-            elif feedback_type == 'user_engagement':
-                self._handle_engagement_feedback(value, context)
-            else:
-                print(f"Unknown feedback type: {feedback_type}")
+
+        # Handlers dispatch to the update_* writers, which each take the
+        # write lock for one publish; paired updates are therefore not
+        # atomic, and interleaved feedback resolves last-writer-wins
+        if feedback_type == 'success':
+            self._handle_success_feedback(value, context)
+        elif feedback_type == 'failure':
+            self._handle_failure_feedback(value, context)
+        elif feedback_type == 'uncertainty':
+            self._handle_uncertainty_feedback(value, context)
+        elif feedback_type == 'novelty':
+            self._handle_novelty_feedback(value, context)
+        elif feedback_type == 'user_engagement':
+            self._handle_engagement_feedback(value, context)
+        else:
+            print(f"Unknown feedback type: {feedback_type}")
     
     def modulate_agent_behavior(self, agent_type: AgentType, base_confidence: float, 
                               base_temperature: float = 0.7) -> Dict[str, float]:
@@ -141,34 +135,34 @@ class NeuromodulationController:
         Returns:
             Dict with modulated parameters
         """
-        with self.lock:
-            self._apply_decay()
-            
-            # Attention gain affects confidence thresholds
-            attention_factor = self.state.attention_gain
-            modulated_confidence = base_confidence * attention_factor
-            
-            # Exploration noise and attention affect temperature and creativity
-            explore_factor = 1.0 + self.state.explore_noise
-            # Higher attention reduces temperature (more deterministic)
-            modulated_temperature = base_temperature / max(self.state.attention_gain, 0.1)
-            
-            # Reward signal affects learning rate and persistence
-            reward_factor = 1.0 + (self.state.reward_signal * 0.5)
-            modulated_learning_rate = self.learning_rate * reward_factor
-            
-            # Agent-specific modulations
-            agent_modulations = self._get_agent_specific_modulations(agent_type)
-            
-            return {
-                'confidence': min(modulated_confidence, 1.0),
-                'temperature': min(modulated_temperature, 2.0),
-                'learning_rate': modulated_learning_rate,
-                'attention_factor': attention_factor,
-                'explore_factor': explore_factor,
-                'reward_factor': reward_factor,
-                **agent_modulations
-            }
+        # Work from one decayed snapshot so all factors are consistent
+        state = self._decayed(self._state)
+
+        # Attention gain affects confidence thresholds
+        attention_factor = state.attention_gain
+        modulated_confidence = base_confidence * attention_factor
+
+        # Exploration noise and attention affect temperature and creativity
+        explore_factor = 1.0 + state.explore_noise
+        # Higher attention reduces temperature (more deterministic)
+        modulated_temperature = base_temperature / max(state.attention_gain, 0.1)
+
+        # Reward signal affects learning rate and persistence
+        reward_factor = 1.0 + (state.reward_signal * 0.5)
+        modulated_learning_rate = self.learning_rate * reward_factor
+
+        # Agent-specific modulations
+        agent_modulations = self._get_agent_specific_modulations(agent_type, state)
+
+        return {
+            'confidence': min(modulated_confidence, 1.0),
+            'temperature': min(modulated_temperature, 2.0),
+            'learning_rate': modulated_learning_rate,
+            'attention_factor': attention_factor,
+            'explore_factor': explore_factor,
+            'reward_factor': reward_factor,
+            **agent_modulations
+        }
     
     def modulate_gating_thresholds(self, base_threshold: float) -> float:
         """
@@ -180,54 +174,64 @@ class NeuromodulationController:
         Returns:
             Modulated threshold
         """
-        with self.lock:
-            # Higher attention gain = higher thresholds (more selective)
-            attention_factor = 1.0 + (self.state.attention_gain - 1.0) * 0.3
-            
-            # Higher reward signal = lower thresholds (more permissive)
-            reward_factor = 1.0 - (self.state.reward_signal * 0.2)
-            
-            modulated_threshold = base_threshold * attention_factor * reward_factor
-            
-            return max(0.1, min(0.9, modulated_threshold))
+        state = self._state
+
+        # Higher attention gain = higher thresholds (more selective)
+        attention_factor = 1.0 + (state.attention_gain - 1.0) * 0.3
+
+        # Higher reward signal = lower thresholds (more permissive)
+        reward_factor = 1.0 - (state.reward_signal * 0.2)
+
+        modulated_threshold = base_threshold * attention_factor * reward_factor
+
+        return max(0.1, min(0.9, modulated_threshold))
     
     def add_update_callback(self, callback: Callable[[NeuromodulatorState], None]) -> None:
         """Add callback for neuromodulator state updates"""
-        with self.lock:
-            self.update_callbacks.append(callback)
-    
+        # The callback tuple is swapped atomically so notifiers iterate
+        # a consistent snapshot without holding a lock
+        with self._write_lock:
+            self.update_callbacks = self.update_callbacks + (callback,)
+
     def remove_update_callback(self, callback: Callable[[NeuromodulatorState], None]) -> None:
         """Remove update callback"""
-        with self.lock:
-            if callback in self.update_callbacks:
-                self.update_callbacks.remove(callback)
+        with self._write_lock:
+            self.update_callbacks = tuple(
+                registered for registered in self.update_callbacks
+                if registered is not callback
+            )
     
-    def _apply_decay(self) -> None:
-        """Apply natural decay to neuromodulator values"""
+    def _decayed(self, state: NeuromodulatorState) -> NeuromodulatorState:
+        """Derive the naturally decayed state as of now.
+
+        Pure function of the given snapshot: readers call it without a
+        lock, writers persist its result when publishing the next one.
+        """
         now = datetime.now()
-        time_since_update = (now - self.state.timestamp).total_seconds() / 3600.0  # hours
-        
-        if time_since_update > 0:
-            # Decay towards target values
-            self.state.attention_gain = self._decay_towards_target(
-                self.state.attention_gain, 
+        time_since_update = (now - state.timestamp).total_seconds() / 3600.0  # hours
+
+        if time_since_update <= 0:
+            return state
+
+        # Decay towards target values
+        return NeuromodulatorState(
+            attention_gain=self._decay_towards_target(
+                state.attention_gain,
                 self.adaptive_thresholds['attention_gain']['target'],
                 time_since_update
-            )
-            
-            self.state.explore_noise = self._decay_towards_target(
-                self.state.explore_noise,
+            ),
+            explore_noise=self._decay_towards_target(
+                state.explore_noise,
                 self.adaptive_thresholds['explore_noise']['target'],
                 time_since_update
-            )
-            
-            self.state.reward_signal = self._decay_towards_target(
-                self.state.reward_signal,
+            ),
+            reward_signal=self._decay_towards_target(
+                state.reward_signal,
                 self.adaptive_thresholds['reward_signal']['target'],
                 time_since_update
-            )
-            
-            self.state.timestamp = now
+            ),
+            timestamp=now
+        )
     
     def _decay_towards_target(self, current: float, target: float, time_delta: float) -> float:
         """Decay current value towards target over time"""
@@ -266,9 +270,10 @@ class NeuromodulationController:
     
     def _notify_callbacks(self) -> None:
         """Notify all registered callbacks of state changes"""
+        state = self._state
         for callback in self.update_callbacks:
             try:
-                callback(self.state)
+                callback(state)
             except Exception as e:
                 print(f"Error in neuromodulator callback: {e}")
     
@@ -317,72 +322,74 @@ class NeuromodulationController:
         self.update_reward_signal(reward_delta, f"Engagement feedback: {value}")
         self.update_attention_gain(attention_delta, f"Engagement feedback: {value}")
     
-    def _get_agent_specific_modulations(self, agent_type: AgentType) -> Dict[str, float]:
+    def _get_agent_specific_modulations(self, agent_type: AgentType,
+                                        state: NeuromodulatorState) -> Dict[str, float]:
         """Get agent-specific modulation parameters"""
         modulations = {}
         
         if agent_type == AgentType.CREATIVE:
             # Creative agents benefit from higher exploration
-            modulations['creativity_boost'] = 1.0 + self.state.explore_noise * 0.5
-            modulations['novelty_threshold'] = 0.5 - (self.state.explore_noise * 0.3)
+            modulations['creativity_boost'] = 1.0 + state.explore_noise * 0.5
+            modulations['novelty_threshold'] = 0.5 - (state.explore_noise * 0.3)
         
         elif agent_type == AgentType.LOGICAL:
             # Logical agents benefit from higher attention
-            modulations['precision_boost'] = 1.0 + (self.state.attention_gain - 1.0) * 0.3
-            modulations['confidence_threshold'] = 0.7 + (self.state.attention_gain - 1.0) * 0.2
+            modulations['precision_boost'] = 1.0 + (state.attention_gain - 1.0) * 0.3
+            modulations['confidence_threshold'] = 0.7 + (state.attention_gain - 1.0) * 0.2
         
         elif agent_type == AgentType.EMOTIONAL:
             # Emotional agents are sensitive to reward signals
-            modulations['empathy_boost'] = 1.0 + self.state.reward_signal * 0.4
-            modulations['sensitivity'] = 0.5 + self.state.reward_signal * 0.3
+            modulations['empathy_boost'] = 1.0 + state.reward_signal * 0.4
+            modulations['sensitivity'] = 0.5 + state.reward_signal * 0.3
         
         elif agent_type == AgentType.STRATEGIC:
             # Strategic agents balance exploration and attention
-            modulations['planning_horizon'] = 1.0 + self.state.explore_noise * 0.3
-            modulations['risk_tolerance'] = 0.5 + self.state.reward_signal * 0.2
+            modulations['planning_horizon'] = 1.0 + state.explore_noise * 0.3
+            modulations['risk_tolerance'] = 0.5 + state.reward_signal * 0.2
         
         elif agent_type == AgentType.VERIFIER:
             # Verifier agents benefit from high attention
-            modulations['verification_strictness'] = 1.0 + (self.state.attention_gain - 1.0) * 0.4
-            modulations['evidence_threshold'] = 0.8 + (self.state.attention_gain - 1.0) * 0.1
+            modulations['verification_strictness'] = 1.0 + (state.attention_gain - 1.0) * 0.4
+            modulations['evidence_threshold'] = 0.8 + (state.attention_gain - 1.0) * 0.1
         
         return modulations
     
     def get_adaptive_thresholds(self) -> Dict[str, Any]:
         """Get current adaptive thresholds"""
-        with self.lock:
-            return {
-                'attention_gain': {
-                    'current': self.state.attention_gain,
-                    'target': self.adaptive_thresholds['attention_gain']['target'],
-                    'range': (self.adaptive_thresholds['attention_gain']['min'], 
-                             self.adaptive_thresholds['attention_gain']['max'])
-                },
-                'explore_noise': {
-                    'current': self.state.explore_noise,
-                    'target': self.adaptive_thresholds['explore_noise']['target'],
-                    'range': (self.adaptive_thresholds['explore_noise']['min'], 
-                             self.adaptive_thresholds['explore_noise']['max'])
-                },
-                'reward_signal': {
-                    'current': self.state.reward_signal,
-                    'target': self.adaptive_thresholds['reward_signal']['target'],
-                    'range': (self.adaptive_thresholds['reward_signal']['min'], 
-                             self.adaptive_thresholds['reward_signal']['max'])
-                }
+        state = self._state
+        return {
+            'attention_gain': {
+                'current': state.attention_gain,
+                'target': self.adaptive_thresholds['attention_gain']['target'],
+                'range': (self.adaptive_thresholds['attention_gain']['min'],
+                         self.adaptive_thresholds['attention_gain']['max'])
+            },
+            'explore_noise': {
+                'current': state.explore_noise,
+                'target': self.adaptive_thresholds['explore_noise']['target'],
+                'range': (self.adaptive_thresholds['explore_noise']['min'],
+                         self.adaptive_thresholds['explore_noise']['max'])
+            },
+            'reward_signal': {
+                'current': state.reward_signal,
+                'target': self.adaptive_thresholds['reward_signal']['target'],
+                'range': (self.adaptive_thresholds['reward_signal']['min'],
+                         self.adaptive_thresholds['reward_signal']['max'])
             }
+        }
     
     def get_history_stats(self) -> Dict[str, Any]:
         """Get statistics from neuromodulator history"""
-        with self.lock:
-            return {
-                'attention_updates': len(self.attention_history),
-                'exploration_updates': len(self.exploration_history),
-                'reward_updates': len(self.reward_history),
-                'recent_attention_trend': self._calculate_trend(self.attention_history),
-                'recent_exploration_trend': self._calculate_trend(self.exploration_history),
-                'recent_reward_trend': self._calculate_trend(self.reward_history)
-            }
+        # len() and the trailing-window trend slices are atomic under
+        # the GIL, so stats reads don't block writers
+        return {
+            'attention_updates': len(self.attention_history),
+            'exploration_updates': len(self.exploration_history),
+            'reward_updates': len(self.reward_history),
+            'recent_attention_trend': self._calculate_trend(self.attention_history),
+            'recent_exploration_trend': self._calculate_trend(self.exploration_history),
+            'recent_reward_trend': self._calculate_trend(self.reward_history)
+        }
     
     def _calculate_trend(self, history: List[Dict[str, Any]], window: int = 10) -> float:
         """Calculate trend in recent updates"""
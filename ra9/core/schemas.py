@@ -103,11 +103,15 @@ class ActiveRepresentation:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class NeuromodulatorState:
-    """Neuromodulation control signals"""
+    """Neuromodulation control signals.
+
+    Immutable: the controller publishes a fresh snapshot on every update
+    so readers can take the current reference without locking.
+    """
     attention_gain: float = 1.0  # ACh analog
-    explore_noise: float = 0.2   # NE analog  
+    explore_noise: float = 0.2   # NE analog
     reward_signal: float = 0.0   # DA analog
     timestamp: datetime = field(default_factory=datetime.now)
 
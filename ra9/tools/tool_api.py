@@ -1,10 +1,16 @@
 import requests, os
 from dotenv import load_dotenv
+import asyncio
 import json
 import time
 from tenacity import retry, stop_after_attempt, wait_exponential
 from typing import Dict, Any, Optional
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional async transport
+    httpx = None
+
 load_dotenv()
 
 
@@ -157,4 +163,77 @@ def ask_gemini(prompt):
             print(f"Full response: {response.json()}")
         except Exception:
             pass
+        return "Error: Unexpected response structure from Gemini API."
+
+
+@retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=2, max=30))
+async def ask_gemini_async(prompt, client=None):
+    """Async variant of ask_gemini for concurrent fan-out.
+
+    Awaiting on a shared httpx.AsyncClient lets N in-flight calls wait on
+    sockets in one event loop instead of N blocked threads, and amortizes
+    TCP/TLS setup across them. Falls back to running the sync path in a
+    worker thread when httpx is unavailable, no client is supplied, or a
+    non-Gemini provider is configured.
+    """
+    load_dotenv()
+    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    OFFLINE = os.getenv("RA9_OFFLINE", "false").lower() in ("1", "true", "yes")
+    LLM_PROVIDER = os.getenv("RA9_LLM_PROVIDER", "gemini").lower()
+
+    if OFFLINE:
+        return f"[mock-gemini] {prompt[:240]}"
+
+    if httpx is None or client is None or LLM_PROVIDER != "gemini":
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, ask_gemini, prompt)
+
+    url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+    headers = {"Content-Type": "application/json"}
+    params = {"key": GEMINI_API_KEY}
+    json_payload = {"contents": [{"parts": [{"text": prompt}]}]}
+
+    try:
+        response = await client.post(
+            url,
+            headers=headers,
+            params=params,
+            json=json_payload,
+            timeout=60
+        )
+
+        try:
+            response_json = response.json()
+        except ValueError:
+            response_json = None
+        if isinstance(response_json, dict) and response_json.get("error"):
+            status = response.status_code
+            if status in (429, 503):
+                print(f"HTTP {status} from Gemini. Retrying with backoff...")
+                raise httpx.HTTPStatusError(
+                    response_json["error"].get("message", "API error"),
+                    request=response.request, response=response)
+            return f"Error: Failed to connect to Gemini API. Status code: {status}"
+
+        response.raise_for_status()
+
+        if response_json and 'candidates' in response_json and len(response_json['candidates']) > 0:
+            return response_json['candidates'][0]['content']['parts'][0]['text']
+        print(f"DEBUG: Unexpected Gemini API response (no candidates): {response_json}")
+        return "Error: Gemini API did not return candidates."
+
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        if status in (429, 503):
+            raise  # trigger retry
+        print(f"HTTP Error: {e}")
+        return f"Error: Failed to connect to Gemini API. Status code: {status}"
+    except httpx.TimeoutException as e:
+        print(f"Timeout Error: {e}")
+        raise  # trigger retry
+    except httpx.TransportError as e:
+        print(f"Connection Error: {e}")
+        raise  # trigger retry
+    except KeyError as e:
+        print(f"KeyError in Gemini API response: {e}")
         return "Error: Unexpected response structure from Gemini API."
\ No newline at end of file
@@ -0,0 +1,30 @@
+from ra9.core.meta_coherence_engine import ConflictDetector
+from ra9.core.schemas import AgentOutput, AgentType
+
+
+def _output(agent, text):
+    return AgentOutput(agent=agent, text_draft=text, reasoning_trace=[], confidence=0.8)
+
+
+def test_hedged_sentence_is_skipped_whole_not_mangled():
+    detector = ConflictDetector()
+    claims = detector._extract_claims(
+        "However the outlook remains fragile. "
+        "The schedule may hold but the team is stretched thin."
+    )
+    assert claims == ("The schedule may hold but the team is stretched thin",)
+
+
+def test_hedge_leading_draft_still_raises_inconsistency():
+    detector = ConflictDetector()
+    logical = _output(
+        AgentType.LOGICAL,
+        "The rollout plan is sound and the schedule is realistic.",
+    )
+    emotional = _output(
+        AgentType.EMOTIONAL,
+        "However the outlook remains fragile. "
+        "The schedule may hold but the team is stretched thin.",
+    )
+    tickets = detector.detect_conflicts([logical, emotional])
+    assert any(ticket.conflict_type == "inconsistency" for ticket in tickets)